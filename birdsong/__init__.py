@@ -0,0 +1,26 @@
+# Bird sound classification engine. Public names are resolved on first access, so
+# `import birdsong` stays cheap and TensorFlow / librosa load only when actually used.
+from importlib import import_module
+
+_EXPORTS = {
+    "Classifier": "birdsong.engine",
+    "top_species": "birdsong.engine",
+    "load_backend": "birdsong.backends",
+    "load_audio": "birdsong.decode",
+    "melspectrogram_batch": "birdsong.melspec",
+    "analyze_recording": "birdsong.windows",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'birdsong' has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
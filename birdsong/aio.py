@@ -0,0 +1,188 @@
+import argparse
+import asyncio
+import collections
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from birdsong.engine import Classifier, top_species
+from birdsong.melspec import melspectrogram_batch, to_three_channels
+
+
+# Executor job: decode + spectrogram of one source (module level so a process pool can pickle it)
+def _spectrogram(source, frontend_kwargs):
+    return melspectrogram_batch([source], **frontend_kwargs)[0]
+
+
+# Start method for the feature processes. The model (TensorFlow and its runtime threads) is
+# loaded in this process, and forking a multi-threaded process can deadlock the children and
+# hands each one a copy of the model; forkserver/spawn children start from a fresh interpreter.
+def _process_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+# Three-stage asyncio pipeline: decode + spectrogram in a process (or thread) pool, batching,
+# and the model in its own thread, connected by bounded queues. While the model runs one
+# batch the feature workers keep filling the next, so both stages keep their cores busy
+# instead of taking turns; when the model falls behind the queues fill up and submit()
+# waits, which bounds memory however many sources are offered.
+#   feature_workers: concurrent decode jobs (default: CPU count)
+#   queue_size: bound of the source and spectrogram queues
+#   max_wait: how long the model stage waits to fill a batch after its first spectrogram
+class AsyncPipeline:
+    def __init__(self, classifier=None, feature_workers=None, executor="process", batch_size=16, queue_size=64, max_wait=0.01):
+        self.classifier = classifier or Classifier()
+        self.feature_workers = feature_workers or os.cpu_count() or 1
+        self.executor = executor
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self.batches = 0
+
+    async def start(self):
+        self._sources = asyncio.Queue(self.queue_size)
+        self._spectrograms = asyncio.Queue(self.queue_size)
+        if self.executor == "process":
+            self._feature_pool = ProcessPoolExecutor(max_workers=self.feature_workers, mp_context=_process_context())
+        else:
+            self._feature_pool = ThreadPoolExecutor(max_workers=self.feature_workers)
+        self._model_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model")
+        # Load the model before the first batch arrives
+        await asyncio.get_running_loop().run_in_executor(self._model_pool, lambda: self.classifier.backend)
+        self._workers = [asyncio.create_task(self._feature_worker()) for _ in range(self.feature_workers)]
+        self._model_task = asyncio.create_task(self._model_stage())
+        return self
+
+    async def close(self):
+        for _ in self._workers:
+            await self._sources.put(None)
+        await asyncio.gather(*self._workers)
+        await self._spectrograms.put(None)
+        await self._model_task
+        self._feature_pool.shutdown()
+        self._model_pool.shutdown()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # Queue one source (path, file bytes or waveform); waits while the pipeline is full.
+    # Returns a future for its (classes,) probabilities.
+    async def submit(self, source):
+        future = asyncio.get_running_loop().create_future()
+        await self._sources.put((source, future))
+        return future
+
+    async def classify(self, source):
+        return await (await self.submit(source))
+
+    async def _feature_worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._sources.get()
+            if item is None:
+                return
+            source, future = item
+            try:
+                spectrogram = await loop.run_in_executor(self._feature_pool, _spectrogram, source, self.classifier.frontend_kwargs)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            await self._spectrograms.put((spectrogram, future))
+
+    async def _next_batch(self):
+        first = await self._spectrograms.get()
+        if first is None:
+            return None, True
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._spectrograms.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _model_stage(self):
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            batch, done = await self._next_batch()
+            if not batch:
+                continue
+            inputs = to_three_channels(np.stack([spectrogram for spectrogram, _ in batch]))
+            try:
+                probabilities = await loop.run_in_executor(self._model_pool, self.classifier.predict_batch, inputs)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            for (_, future), row in zip(batch, probabilities):
+                future.set_result(row)
+
+
+# Classify many sources through the pipeline, yielding (source, probabilities or exception) in
+# input order. At most `window` sources are in flight, so a huge listing never sits in memory.
+async def classify_stream(sources, window=256, **pipeline_kwargs):
+    async with AsyncPipeline(**pipeline_kwargs) as pipeline:
+        pending = collections.deque()
+        for source in sources:
+            pending.append((source, await pipeline.submit(source)))
+            while len(pending) >= window or (pending and pending[0][1].done()):
+                yield await _resolve(*pending.popleft())
+        while pending:
+            yield await _resolve(*pending.popleft())
+
+
+async def _resolve(source, future):
+    try:
+        return source, await future
+    except Exception as e:
+        return source, e
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify audio files through the asyncio pipeline")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--model", help="model path (default: BIRDSONG_MODEL, the inference export, or the checkpoint)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--queue-size", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    classifier = Classifier(backend_config={"path": args.model} if args.model else None)
+
+    async def run():
+        count = 0
+        start = time.perf_counter()
+        async for source, result in classify_stream(args.files, classifier=classifier, feature_workers=args.workers,
+                                                     executor=args.executor, batch_size=args.batch_size,
+                                                     queue_size=args.queue_size):
+            count += 1
+            if isinstance(result, Exception):
+                print(f"{source}\terror\t{type(result).__name__}: {result}")
+            else:
+                best = top_species(result, k=1)[0]
+                print(f"{source}\t{best['label']}\t{best['probability']:.3f}")
+        elapsed = time.perf_counter() - start
+        print(f"{count} files in {elapsed:.1f}s ({count / elapsed:.1f} files/s)")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from birdsong.inference import CompiledPredictor, SavedModelPredictor, TFLitePredictor, measure_latency
+
+CHECKPOINT = "model_checkpoint_epochft_05.keras"
+INFERENCE_MODEL = "inference_model"
+
+
+# Interchangeable inference runtimes. A backend is configured with a model path (and runtime
+# options), loads it in load(), and maps (batch, 256, 256, 3) float32 spectrograms to
+# (batch, classes) probabilities in predict_batch(); nothing else in the app depends on the runtime.
+class Backend:
+    name = None
+
+    def __init__(self, path, input_shape=(256, 256, 3), **options):
+        self.path = path
+        self.input_shape = tuple(input_shape)
+        self.options = options
+        self._predict = None
+
+    def load(self):
+        raise NotImplementedError
+
+    def warmup(self, batch_size=1):
+        self.predict_batch(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        return self
+
+    def predict_batch(self, batch):
+        if self._predict is None:
+            raise RuntimeError(f"{type(self).__name__} is not loaded, call load() first")
+        return self._predict(batch)
+
+    __call__ = predict_batch
+
+    # Identifies the model weights: changes when the file (or SavedModel graph) is replaced,
+    # so results cached under an older version are never served for the new one
+    @property
+    def version(self):
+        path = self.path
+        if os.path.isdir(path) and os.path.exists(os.path.join(path, "saved_model.pb")):
+            path = os.path.join(path, "saved_model.pb")
+        stat = os.stat(path)
+        return f"{self.name}:{os.path.abspath(self.path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r})"
+
+
+# Training checkpoint (or any .keras model) behind a compiled tf.function; jit_compile=True enables XLA
+class KerasBackend(Backend):
+    name = "keras"
+
+    def load(self):
+        from birdsong.model import load_checkpoint
+        self._predict = CompiledPredictor(load_checkpoint(self.path), input_shape=self.input_shape,
+                                          jit_compile=self.options.get("jit_compile", False), warmup=False)
+        return self
+
+
+# SavedModel written by python -m birdsong.export inference
+class SavedModelBackend(Backend):
+    name = "savedmodel"
+
+    def load(self):
+        self._predict = SavedModelPredictor(self.path, warmup=False)
+        return self
+
+
+# .tflite model written by python -m birdsong.tflite
+class TFLiteBackend(Backend):
+    name = "tflite"
+
+    def load(self):
+        self._predict = TFLitePredictor(self.path, num_threads=self.options.get("num_threads"), warmup=False)
+        return self
+
+
+# ONNX model (e.g. python -m tf2onnx.convert --saved-model inference_model --output model.onnx)
+# run with ONNX Runtime; providers defaults to every execution provider this onnxruntime build
+# has, in its priority order (GPU builds refuse to create a session without an explicit list)
+class ONNXBackend(Backend):
+    name = "onnx"
+
+    def load(self):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        if self.options.get("num_threads"):
+            options.intra_op_num_threads = self.options["num_threads"]
+        providers = self.options.get("providers") or onnxruntime.get_available_providers()
+        session = onnxruntime.InferenceSession(self.path, options, providers=providers)
+        input_name = session.get_inputs()[0].name
+
+        def predict(batch):
+            return session.run(None, {input_name: np.asarray(batch, dtype=np.float32)})[0]
+
+        self._predict = predict
+        return self
+
+
+BACKENDS = {backend.name: backend for backend in (KerasBackend, SavedModelBackend, TFLiteBackend, ONNXBackend)}
+
+
+# Backend name for a model path: .tflite, .onnx, a SavedModel directory, else a Keras model
+def backend_for_path(path):
+    if path.endswith(".tflite"):
+        return "tflite"
+    if path.endswith(".onnx"):
+        return "onnx"
+    if os.path.isdir(path):
+        return "savedmodel"
+    return "keras"
+
+
+# Configured backend, loaded and warmed up. config is a dict with "path", optionally "backend"
+# (inferred from the path otherwise) and runtime options such as "num_threads" or "jit_compile".
+# Without a config, BIRDSONG_MODEL, BIRDSONG_BACKEND and BIRDSONG_JIT_COMPILE from the environment
+# are used; the model defaults to the inference-only export when it exists, else the checkpoint.
+def load_backend(config=None, warmup=True):
+    config = dict(config or {})
+    if "path" not in config:
+        default = INFERENCE_MODEL if os.path.isdir(INFERENCE_MODEL) else CHECKPOINT
+        config["path"] = os.environ.get("BIRDSONG_MODEL", default)
+        if os.environ.get("BIRDSONG_BACKEND"):
+            config.setdefault("backend", os.environ["BIRDSONG_BACKEND"])
+        if os.environ.get("BIRDSONG_JIT_COMPILE") == "1":
+            config.setdefault("jit_compile", True)
+    name = config.pop("backend", None) or backend_for_path(config["path"])
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {sorted(BACKENDS)}")
+    backend = BACKENDS[name](**config).load()
+    if warmup:
+        backend.warmup()
+    return backend
+
+
+# Compare backends on identical inputs: load and first-call time, per-batch latency and
+# throughput at each batch size, and the largest probability difference from the first backend
+def benchmark_backends(configs, batch_sizes=(1, 8, 32), repeats=20, seed=0):
+    rng = np.random.default_rng(seed)
+    inputs = rng.uniform(0, 255, (max(batch_sizes), 256, 256, 3)).astype(np.float32)
+    results = []
+    reference = None
+    for config in configs:
+        start = time.perf_counter()
+        backend = load_backend(config, warmup=False)
+        load_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        backend.warmup()
+        warmup_seconds = time.perf_counter() - start
+
+        probabilities = backend.predict_batch(inputs)
+        if reference is None:
+            reference = probabilities
+        result = {"backend": repr(backend), "load_s": load_seconds, "warmup_s": warmup_seconds,
+                  "max_abs_delta": float(np.abs(probabilities - reference).max())}
+        for batch_size in batch_sizes:
+            latency = measure_latency(backend.predict_batch, inputs[:batch_size], repeats=repeats, warmup=2)
+            result[f"batch{batch_size}"] = {**latency, "examples_per_second": batch_size * 1000 / latency["mean_ms"]}
+        results.append(result)
+    return results
+
+
+# "name:path" or just "path" (backend inferred from the path)
+def _parse_spec(spec):
+    name, sep, path = spec.partition(":")
+    if sep and name in BACKENDS:
+        return {"backend": name, "path": path}
+    return {"path": spec}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark inference backends on identical inputs")
+    parser.add_argument("models", nargs="+", help="model paths, optionally prefixed by a backend name (tflite:model.tflite)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--num-threads", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    configs = [_parse_spec(spec) for spec in args.models]
+    if args.num_threads:
+        for config in configs:
+            if config.get("backend", backend_for_path(config["path"])) in ("tflite", "onnx"):
+                config["num_threads"] = args.num_threads
+    for result in benchmark_backends(configs, batch_sizes=args.batch_sizes, repeats=args.repeats):
+        print(f"{result['backend']}: load {result['load_s']:.2f}s, warmup {result['warmup_s']:.2f}s, "
+              f"max |dp| vs first {result['max_abs_delta']:.2e}")
+        for batch_size in args.batch_sizes:
+            r = result[f"batch{batch_size}"]
+            print(f"  batch {batch_size:>3}: p50 {r['p50_ms']:.1f} ms, p99 {r['p99_ms']:.1f} ms, {r['examples_per_second']:.1f} examples/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from birdsong.melspec import melspectrogram_batch
+
+FRONTEND_DEFAULTS = {"sr": 22050, "n_fft": 2048, "hop_length": 512, "n_mels": 128, "duration": 5, "img_size": 256, "geometry": "resize"}
+
+
+# Raw bytes of an upload, or the contents of a file on disk
+def audio_bytes(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    with open(source, "rb") as f:
+        return f.read()
+
+
+# Content address: hash of the audio bytes plus every front-end parameter that changes the output
+def feature_key(data, dtype="float16", **params):
+    params = {**FRONTEND_DEFAULTS, **params, "dtype": dtype}
+    params.pop("chunk_size", None)
+    digest = hashlib.sha256(bytes(data))
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Content address of an analysis result: the audio bytes, the model version and the analysis options
+def result_key(data, model_version, **options):
+    digest = hashlib.sha256(bytes(data))
+    digest.update(json.dumps({"model": model_version, **options}, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# In-memory LRU of finished analyses (spectrogram, probabilities, ...) keyed by result_key.
+# One instance is shared by every session of a process, so re-analyzing a recording that
+# anyone has already analyzed skips decode, spectrogram and model. Holds at most max_entries
+# results; hits and misses are counted for the stats display.
+class ResultCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"entries": len(self._entries), "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+
+# Persistent spectrogram cache. Entries are .npy files named by feature_key, stored as
+# float16 (half the size of float32, within ~0.1 on the 0-255 scale) or uint8 (a quarter,
+# but rounded and clipped to 0-255, which cuts off the Lanczos overshoot), and read back
+# memory-mapped so a hit costs no decode, no STFT and no copy. The least recently used
+# entries are evicted once the cache grows past max_bytes. One instance can be shared by
+# threads (the app's sessions and upload workers): the size count and eviction are locked.
+class FeatureCache:
+    def __init__(self, root, max_bytes=2 * 1024 ** 3, dtype="float16"):
+        if dtype not in ("uint8", "float16"):
+            raise ValueError(f"Unsupported cache dtype {dtype!r}, expected 'uint8' or 'float16'")
+        self.root = root
+        self.max_bytes = max_bytes
+        self.dtype = dtype
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(size for _, size, _ in self._entries())
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".npy")
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".npy"):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield path, stat.st_size, stat.st_mtime
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            spectrogram = np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        # Touch on read so eviction is least-recently-used rather than oldest-written
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another thread since the load
+            return None
+        return spectrogram
+
+    # The array as stored: float16, or uint8 rounded and clipped to 0-255
+    def _encode(self, spectrogram):
+        if self.dtype == "uint8":
+            return np.clip(np.rint(spectrogram), 0, 255).astype(np.uint8)
+        return np.asarray(spectrogram, dtype=np.float16)
+
+    def put(self, key, spectrogram):
+        spectrogram = self._encode(spectrogram)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, spectrogram)
+        with self._lock:
+            # Another session may have stored the same upload already; count the entry once
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            self._size += os.path.getsize(path) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def evict(self):
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._size = total
+
+    # Spectrograms for N paths or uploads: hits come straight from disk, the misses are
+    # computed together in one melspectrogram_batch call and stored
+    def melspectrogram_batch(self, sources, **params):
+        data = [audio_bytes(source) for source in sources]
+        keys = [feature_key(d, dtype=self.dtype, **params) for d in data]
+        spectrograms = [self.get(key) for key in keys]
+        missing = [i for i, spectrogram in enumerate(spectrograms) if spectrogram is None]
+        if missing:
+            # Decode from the bytes already read for hashing
+            computed = melspectrogram_batch([data[i] for i in missing], **params)
+            for i, spectrogram in zip(missing, computed):
+                self.put(keys[i], spectrogram)
+                spectrograms[i] = self.get(keys[i])
+                if spectrograms[i] is None:
+                    # Already evicted again (tiny cache, or another thread): use the stored form from memory
+                    spectrograms[i] = self._encode(spectrogram)
+        return spectrograms
+
+    def melspectrogram(self, source, **params):
+        return self.melspectrogram_batch([source], **params)[0]
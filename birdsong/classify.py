@@ -0,0 +1,301 @@
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import queue
+import time
+
+import numpy as np
+
+from birdsong.engine import Classifier
+from birdsong.melspec import to_three_channels
+from birdsong.species import load_species
+from birdsong.windows import iter_window_spectrograms
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3")
+
+
+# Audio files under a directory (recursively, sorted), or listed in a manifest: a CSV with an
+# "audio" column (like audio.csv) or a plain text file with one path per line
+def list_recordings(source):
+    if os.path.isdir(source):
+        files = []
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames.sort()
+            files.extend(os.path.join(dirpath, name) for name in sorted(filenames) if name.lower().endswith(AUDIO_EXTENSIONS))
+        return files
+    with open(source, newline="") as f:
+        if source.endswith(".csv"):
+            return [row["audio"] for row in csv.DictReader(f)]
+        return [line.strip() for line in f if line.strip()]
+
+
+# Worker process: takes paths from `tasks` until a None, and streams each recording's windows
+# to `results` as ("windows", path, starts, spectrograms) chunks of at most chunk_size, then
+# ("done", path, error). `results` is bounded, so a worker waits while the model stage is
+# behind and never holds more than one chunk, however long the recording. Spectrograms
+# travel as float16 (like the feature cache and TFRecord shards) to halve the queue's size.
+def _window_worker(tasks, results, chunk_size, window_kwargs):
+    while True:
+        path = tasks.get()
+        if path is None:
+            return
+        starts, specs = [], []
+        try:
+            for start, spec in iter_window_spectrograms(path, **window_kwargs):
+                if spec is None:
+                    continue
+                starts.append(start)
+                specs.append(spec.astype(np.float16))
+                if len(starts) == chunk_size:
+                    results.put(("windows", path, starts, np.stack(specs)))
+                    starts, specs = [], []
+            if starts:
+                results.put(("windows", path, starts, np.stack(specs)))
+            results.put(("done", path, None))
+        except Exception as e:
+            results.put(("done", path, f"{type(e).__name__}: {e}"))
+
+
+def _result_columns(top_k):
+    columns = ["file", "window_start"]
+    for rank in range(1, top_k + 1):
+        columns += [f"species_{rank}", f"probability_{rank}"]
+    return columns
+
+
+# Results sink with crash-safe resume. Rows are buffered and flushed in blocks; after each flush
+# a line {"files": [...], ...} is appended to the progress log naming the files whose rows are
+# now complete on disk, plus where the output ended (CSV byte offset or Parquet part name).
+# On resume anything written after the last logged flush is discarded, so a crash mid-flush
+# never leaves partial or duplicated rows, and the logged files are skipped. Output without a
+# progress log was not written by this tool and is left alone unless overwrite=True.
+class ResultWriter:
+    def __init__(self, output, columns, fmt="csv", flush_rows=10000, overwrite=False):
+        self.output = output
+        self.columns = columns
+        self.fmt = fmt
+        self.flush_rows = flush_rows
+        self.progress_path = output.rstrip(os.sep) + ".progress.jsonl"
+        self._rows = []
+        self._files = []
+        self._failed = []
+        self.done = set()
+        if overwrite:
+            self._clear()
+        elif not os.path.exists(self.progress_path) and self._existing_output():
+            raise FileExistsError(f"{output} already has results that were not written by this tool, use --overwrite to replace them")
+        self._recover()
+
+    # Existing CSV content, or Parquet parts in the output directory
+    def _existing_output(self):
+        if self.fmt == "csv":
+            return os.path.exists(self.output) and os.path.getsize(self.output) > 0
+        return os.path.isdir(self.output) and any(name.endswith(".parquet") for name in os.listdir(self.output))
+
+    def _clear(self):
+        if os.path.exists(self.progress_path):
+            os.unlink(self.progress_path)
+        if self.fmt == "csv":
+            if os.path.exists(self.output):
+                os.unlink(self.output)
+        elif os.path.isdir(self.output):
+            for name in os.listdir(self.output):
+                if name.endswith(".parquet"):
+                    os.unlink(os.path.join(self.output, name))
+
+    def _log(self):
+        if not os.path.exists(self.progress_path):
+            return []
+        with open(self.progress_path) as f:
+            entries = []
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break  # torn last line from a crash
+            return entries
+
+    def _recover(self):
+        entries = self._log()
+        for entry in entries:
+            self.done.update(entry["files"])
+            self.done.update(path for path, _ in entry.get("failed", []))
+        if self.fmt == "csv":
+            offsets = [entry["offset"] for entry in entries if "offset" in entry]
+            if os.path.exists(self.output):
+                with open(self.output, "r+b") as f:
+                    f.truncate(offsets[-1] if offsets else 0)
+        else:
+            os.makedirs(self.output, exist_ok=True)
+            parts = {entry["part"] for entry in entries if "part" in entry}
+            for name in os.listdir(self.output):
+                if (name.endswith(".parquet") and name not in parts) or name.endswith(".parquet.tmp"):
+                    os.unlink(os.path.join(self.output, name))
+            self._next_part = len(parts)
+
+    def add(self, path, rows):
+        self._rows.extend(rows)
+        self._files.append(path)
+        if len(self._rows) >= self.flush_rows:
+            self.flush()
+
+    def add_failure(self, path, error):
+        self._failed.append((path, error))
+
+    def flush(self):
+        if not self._files and not self._failed:
+            return
+        entry = {"files": self._files, "failed": self._failed}
+        if self.fmt == "csv":
+            new_file = not os.path.exists(self.output) or os.path.getsize(self.output) == 0
+            with open(self.output, "a", newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(self.columns)
+                writer.writerows(self._rows)
+                f.flush()
+                os.fsync(f.fileno())
+                entry["offset"] = f.tell()
+        elif self._rows:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            name = f"part-{self._next_part:05d}.parquet"
+            table = pa.Table.from_pylist([dict(zip(self.columns, row)) for row in self._rows])
+            tmp_path = os.path.join(self.output, name + ".tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, os.path.join(self.output, name))
+            entry["part"] = name
+            self._next_part += 1
+        with open(self.progress_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.done.update(self._files)
+        self.done.update(path for path, _ in self._failed)
+        self._rows, self._files, self._failed = [], [], []
+
+
+# Classify every recording in `files` window by window. Worker processes decode and compute
+# spectrograms and stream them in chunks of at most batch_size windows; the main process runs
+# one batched model stage over windows from all files and streams top-k rows to the writer.
+# At most max_chunks chunks wait between the stages, so memory depends on batch_size and the
+# worker count, not on how long the recordings are.
+def classify_files(files, writer, classifier, workers=None, batch_size=64, top_k=5, max_chunks=None, **window_kwargs):
+    labels = load_species().labels
+    todo = [path for path in files if path not in writer.done]
+    print(f"{len(files)} recordings, {len(files) - len(todo)} already done, {len(todo)} to go")
+    if not todo:
+        return
+    workers = min(workers or os.cpu_count() or 1, len(todo))
+
+    # Windows waiting for the model: (path, start, spectrogram). A file is complete once its
+    # worker reported it done and none of its windows are still waiting or in a batch.
+    buffer = []
+    remaining = {}
+    rows = {}
+    decoded = set()
+
+    def complete(path):
+        remaining.pop(path, None)
+        decoded.discard(path)
+        writer.add(path, rows.pop(path, []))
+
+    def run_model(force=False):
+        while len(buffer) >= batch_size or (force and buffer):
+            batch, buffer[:] = buffer[:batch_size], buffer[batch_size:]
+            probabilities = classifier.predict_batch(to_three_channels(np.stack([spec for _, _, spec in batch]).astype(np.float32)))
+            top = np.argsort(probabilities, axis=1)[:, ::-1][:, :top_k]
+            for (path, start, _), indices, p in zip(batch, top, probabilities):
+                row = [path, round(float(start), 3)]
+                for idx in indices:
+                    row += [labels[idx], float(p[idx])]
+                rows[path].append(row)
+                remaining[path] -= 1
+                if remaining[path] == 0 and path in decoded:
+                    complete(path)
+
+    context = multiprocessing.get_context()
+    tasks = context.Queue()
+    results = context.Queue(maxsize=max_chunks or 2 * workers)
+    for path in todo:
+        tasks.put(path)
+    for _ in range(workers):
+        tasks.put(None)
+    # Started before the model is loaded, so forked workers do not inherit it
+    processes = [context.Process(target=_window_worker, args=(tasks, results, batch_size, window_kwargs), daemon=True)
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    processed = 0
+    start_time = time.perf_counter()
+    try:
+        while processed < len(todo):
+            try:
+                message = results.get(timeout=1.0)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError(f"Feature workers exited with {len(todo) - processed} recordings unfinished")
+                continue
+            if message[0] == "windows":
+                _, path, starts, specs = message
+                rows.setdefault(path, [])
+                remaining[path] = remaining.get(path, 0) + len(starts)
+                buffer.extend((path, start, spec) for start, spec in zip(starts, specs))
+            else:
+                _, path, error = message
+                processed += 1
+                if error is not None:
+                    # Drop any windows of the file that were already sent
+                    buffer[:] = [item for item in buffer if item[0] != path]
+                    remaining.pop(path, None)
+                    rows.pop(path, None)
+                    writer.add_failure(path, error)
+                else:
+                    decoded.add(path)
+                    if remaining.get(path, 0) == 0:
+                        # Every window scored, or every window silent (no rows)
+                        complete(path)
+                elapsed = time.perf_counter() - start_time
+                print(f"[{processed}/{len(todo)}] {processed / elapsed:.1f} recordings/s", flush=True)
+            run_model()
+        run_model(force=True)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+    writer.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify a directory (or manifest) of recordings window by window into CSV or Parquet")
+    parser.add_argument("source", help="directory of recordings, audio.csv manifest, or text file of paths")
+    parser.add_argument("output", help="CSV file, or directory of Parquet parts with --format parquet")
+    parser.add_argument("--format", choices=["csv", "parquet"], default=None, help="default: from the output name")
+    parser.add_argument("--model", help="model path (default: BIRDSONG_MODEL, the inference export, or the checkpoint)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--window", type=float, default=5.0)
+    parser.add_argument("--hop", type=float, default=5.0)
+    parser.add_argument("--energy-threshold-db", type=float, default=None, help="skip windows quieter than this (1-10 kHz band)")
+    parser.add_argument("--flush-rows", type=int, default=10000)
+    parser.add_argument("--overwrite", action="store_true", help="replace existing output instead of resuming")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.endswith(".csv") else "parquet")
+    classifier = Classifier(backend_config={"path": args.model} if args.model else None)
+    try:
+        writer = ResultWriter(args.output, _result_columns(args.top_k), fmt=fmt, flush_rows=args.flush_rows, overwrite=args.overwrite)
+    except FileExistsError as e:
+        parser.error(str(e))
+    classify_files(list_recordings(args.source), writer, classifier, workers=args.workers, batch_size=args.batch_size,
+                   top_k=args.top_k, window=args.window, hop=args.hop, energy_threshold_db=args.energy_threshold_db,
+                   shared_stft=True)
+
+
+if __name__ == "__main__":
+    main()
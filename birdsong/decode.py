@@ -0,0 +1,103 @@
+import io
+import os
+import tempfile
+
+import numpy as np
+import soundfile as sf
+import soxr
+
+
+# Container format from the leading bytes of an upload, whatever its file name says
+def sniff_format(data):
+    head = bytes(memoryview(data)[:12])
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:3] == b"ID3" or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return None
+
+
+# Decode only [offset, offset + duration) seconds of a recording as mono float32 at sr.
+# source is a path, a file object, or the raw bytes of an upload (bytes/bytearray/memoryview),
+# which are read in memory without touching disk.
+# libsndfile seeks straight to the offset and stops reading after the span for
+# WAV/FLAC/OGG (and MP3 with libsndfile >= 1.1), so long recordings are never decoded in full.
+def load_audio(source, sr=22050, offset=0.0, duration=None):
+    data = None
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = source
+        source = io.BytesIO(source)
+
+    try:
+        with sf.SoundFile(source) as f:
+            sr_native = f.samplerate
+            if offset:
+                f.seek(int(offset * sr_native))
+            frames = int(duration * sr_native) if duration is not None else -1
+            y = f.read(frames=frames, dtype="float32", always_2d=True).T
+    except RuntimeError:
+        # Containers libsndfile cannot open (MP3 on older builds) go through audioread,
+        # which streams from the start and stops once the span has been read
+        if data is None:
+            import librosa
+            y, _ = librosa.load(source, sr=sr, offset=offset, duration=duration)
+            return y
+        return _load_bytes_with_audioread(data, sr=sr, offset=offset, duration=duration)
+
+    y = np.mean(y, axis=0) if y.shape[0] > 1 else y[0]
+    if sr is not None and sr != sr_native:
+        import librosa
+        y = librosa.resample(y, orig_sr=sr_native, target_sr=sr, res_type="soxr_hq")
+    return np.ascontiguousarray(y, dtype=np.float32)
+
+
+# audioread only reads from paths, so this last-resort branch spills the upload
+# to a temporary file named after its real container format
+def _load_bytes_with_audioread(data, sr=22050, offset=0.0, duration=None):
+    fmt = sniff_format(data)
+    if fmt is None:
+        raise ValueError("Unrecognised audio format (expected WAV, FLAC, OGG or MP3)")
+    with tempfile.NamedTemporaryFile(delete=False, suffix="." + fmt) as tmp_file:
+        tmp_file.write(data)
+        tmp_path = tmp_file.name
+    try:
+        import librosa
+        y, _ = librosa.load(tmp_path, sr=sr, offset=offset, duration=duration)
+    finally:
+        os.unlink(tmp_path)
+    return y
+
+
+# Stream a whole recording as consecutive mono float32 blocks at sr, so memory stays
+# bounded however long it is. Resampling uses a streaming soxr resampler (the same
+# "HQ" quality librosa.load uses) so block edges leave no artifacts.
+def iter_blocks(source, sr=22050, block_duration=30.0):
+    original = source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    try:
+        f = sf.SoundFile(source)
+    except RuntimeError:
+        # No streaming decoder for this container; fall back to one block
+        yield load_audio(original, sr=sr)
+        return
+
+    with f:
+        resampler = None
+        if sr is not None and sr != f.samplerate:
+            resampler = soxr.ResampleStream(f.samplerate, sr, 1, dtype="float32", quality="HQ")
+        block_frames = max(int(block_duration * f.samplerate), 1)
+        while True:
+            block = f.read(frames=block_frames, dtype="float32", always_2d=True)
+            last = len(block) < block_frames
+            y = np.mean(block, axis=1) if block.shape[1] > 1 else block[:, 0]
+            if resampler is not None:
+                y = resampler.resample_chunk(y, last=last)
+            if len(y):
+                yield np.ascontiguousarray(y, dtype=np.float32)
+            if last:
+                return
@@ -0,0 +1,48 @@
+import numpy as np
+
+from birdsong.melspec import melspectrogram_batch, to_three_channels
+from birdsong.species import load_species
+
+
+# Audio in, ranked species out, without Streamlit. Importing this module is cheap: the model
+# backend (and TensorFlow, if the backend needs it) is loaded on first use, and librosa only
+# when the first spectrogram is computed. backend_config is passed to load_backend, so the
+# same BIRDSONG_MODEL / BIRDSONG_BACKEND configuration as the app applies by default.
+class Classifier:
+    def __init__(self, backend=None, backend_config=None, **frontend_kwargs):
+        self._backend = backend
+        self.backend_config = backend_config
+        self.frontend_kwargs = frontend_kwargs
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            from birdsong.backends import load_backend
+            self._backend = load_backend(self.backend_config)
+        return self._backend
+
+    # (N, img, img) single-channel spectrograms of the first `duration` seconds of each source
+    def spectrograms(self, sources):
+        return melspectrogram_batch(sources, **self.frontend_kwargs)
+
+    # (N, classes) probabilities for a batch of 3-channel spectrograms (the model's input)
+    def predict_batch(self, batch):
+        return self.backend.predict_batch(batch)
+
+    # (N, classes) probabilities for paths, file objects or uploaded bytes
+    def classify(self, sources):
+        return self.predict_batch(to_three_channels(self.spectrograms(sources)))
+
+    # Every window of one long recording (see birdsong.windows.analyze_recording)
+    def analyze(self, source, **kwargs):
+        from birdsong.windows import analyze_recording
+        return analyze_recording(source, self.predict_batch, **kwargs)
+
+
+# The k most likely species of one probability vector, most likely first (k is clamped to
+# 0..number of classes)
+def top_species(probabilities, k=5, descriptions=False):
+    species = load_species()
+    k = max(0, min(int(k), len(probabilities)))
+    top_indices = np.argsort(probabilities)[::-1][:k]
+    return [{**species.row(idx, description=descriptions), "probability": float(probabilities[idx])} for idx in top_indices]
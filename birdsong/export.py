@@ -0,0 +1,40 @@
+import argparse
+
+from birdsong.model import export_inference_model, export_spectrogram_model, export_waveform_model
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the bird sound classifier for serving")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    waveform = commands.add_parser("waveform", help="SavedModel that takes raw 22.05 kHz waveforms")
+    waveform.add_argument("checkpoint")
+    waveform.add_argument("export_dir")
+    waveform.add_argument("--sr", type=int, default=22050)
+    waveform.add_argument("--duration", type=float, default=5)
+
+    spectrogram = commands.add_parser("spectrogram", help="SavedModel that takes single-channel 256x256 spectrograms")
+    spectrogram.add_argument("checkpoint")
+    spectrogram.add_argument("export_dir")
+    spectrogram.add_argument("--img-size", type=int, default=256)
+
+    inference = commands.add_parser("inference", help="SavedModel of the classifier alone (3-channel 256x256 spectrograms), "
+                                                      "augmentation stripped and BatchNorm folded; used by the app")
+    inference.add_argument("checkpoint")
+    inference.add_argument("export_dir")
+    inference.add_argument("--img-size", type=int, default=256)
+
+    args = parser.parse_args(argv)
+    if args.command == "waveform":
+        export_waveform_model(args.checkpoint, args.export_dir, sr=args.sr, duration=args.duration)
+        print(f"Saved waveform model to {args.export_dir}")
+    elif args.command == "spectrogram":
+        export_spectrogram_model(args.checkpoint, args.export_dir, img_size=args.img_size)
+        print(f"Saved spectrogram model to {args.export_dir}")
+    elif args.command == "inference":
+        export_inference_model(args.checkpoint, args.export_dir, img_size=args.img_size)
+        print(f"Saved inference model to {args.export_dir}")
+
+
+if __name__ == "__main__":
+    main()
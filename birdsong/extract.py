@@ -0,0 +1,153 @@
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import librosa
+
+from birdsong.decode import load_audio
+from birdsong.melspec import melspectrogram_batch
+
+INDEX_NAME = "index.csv"
+FAILED_NAME = "failed.csv"
+INDEX_FIELDS = ["path", "class", "label", "part", "row"]
+
+
+# (path, class name, label) for every file of a BirdCLEF-style train_audio/<class>/<file> tree
+def list_train_audio(root):
+    classes = sorted(name for name in os.listdir(root) if os.path.isdir(os.path.join(root, name)))
+    items = []
+    for label, name in enumerate(classes):
+        for filename in sorted(os.listdir(os.path.join(root, name))):
+            items.append((os.path.join(root, name, filename), name, label))
+    return items, classes
+
+
+# Mean of 40 MFCCs over the whole recording, as features_extractor in the basic notebook
+def mfcc_means(y, sr=22050, n_mfcc=40):
+    return np.mean(librosa.feature.mfcc(y=y, sr=sr, n_mfcc=n_mfcc), axis=1)
+
+
+def _save(path, array):
+    tmp_path = path + ".tmp.npy"
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+# Worker: features for one chunk of files, written as part-NNNNN files in out_dir.
+# Returns the index rows of the files it stored and (path, error) for those it could not read.
+def _extract_part(out_dir, part, items, spectrograms, mfcc, dtype, sr, duration):
+    waveforms, rows, failed = [], [], []
+    for path, name, label in items:
+        try:
+            # MFCC means use the whole recording; the spectrogram only the first `duration` seconds
+            y = load_audio(path, sr=sr, duration=None if mfcc else duration)
+        except Exception as e:
+            failed.append((path, f"{type(e).__name__}: {e}"))
+            continue
+        if len(y) == 0:
+            failed.append((path, "empty recording"))
+            continue
+        waveforms.append(y)
+        rows.append({"path": path, "class": name, "label": label, "part": part, "row": len(rows)})
+
+    if rows:
+        if mfcc:
+            _save(os.path.join(out_dir, f"mfcc-{part:05d}.npy"), np.stack([mfcc_means(y, sr=sr) for y in waveforms]).astype(np.float32))
+        if spectrograms:
+            specs = melspectrogram_batch(waveforms, sr=sr, duration=duration)
+            _save(os.path.join(out_dir, f"spec-{part:05d}.npy"), specs.astype(dtype))
+    return rows, failed
+
+
+def _read_csv(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def _append_csv(path, fields, rows):
+    new_file = not os.path.exists(path)
+    with open(path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+# Extract features for every file under root into out_dir with a process pool. Each finished
+# chunk is checkpointed in index.csv (and failures in failed.csv), so re-running the same
+# command after an interruption only processes the files that are not done yet.
+def extract(root, out_dir, workers=None, chunk_size=32, spectrograms=True, mfcc=False, dtype="float16", sr=22050, duration=5, retry_failed=False):
+    os.makedirs(out_dir, exist_ok=True)
+    index_path = os.path.join(out_dir, INDEX_NAME)
+    failed_path = os.path.join(out_dir, FAILED_NAME)
+    items, classes = list_train_audio(root)
+
+    done = {row["path"] for row in _read_csv(index_path)}
+    if not retry_failed:
+        done |= {row["path"] for row in _read_csv(failed_path)}
+    todo = [item for item in items if item[0] not in done]
+    print(f"{len(items)} files in {len(classes)} classes, {len(items) - len(todo)} already done, {len(todo)} to go")
+
+    # Part numbers continue after anything already on disk, including parts whose
+    # index rows were never written because of an interruption
+    parts = [int(name[5:10]) for name in os.listdir(out_dir) if name[:5] in ("spec-", "mfcc-") and name.endswith(".npy") and ".tmp" not in name]
+    first_part = max(parts, default=-1) + 1
+    chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+
+    processed = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_extract_part, out_dir, first_part + i, chunk, spectrograms, mfcc, dtype, sr, duration)
+                   for i, chunk in enumerate(chunks)]
+        for future in as_completed(futures):
+            rows, failed = future.result()
+            _append_csv(index_path, INDEX_FIELDS, rows)
+            if failed:
+                _append_csv(failed_path, ["path", "error"], [{"path": p, "error": e} for p, e in failed])
+            processed += len(rows) + len(failed)
+            elapsed = time.perf_counter() - start
+            rate = processed / elapsed if elapsed > 0 else 0.0
+            eta = (len(todo) - processed) / rate if rate > 0 else float("nan")
+            print(f"[{processed}/{len(todo)}] {rate:.1f} files/s, ETA {eta / 60:.1f} min", flush=True)
+
+    with open(os.path.join(out_dir, "classes.txt"), "w") as f:
+        f.write("\n".join(classes) + "\n")
+    return index_path
+
+
+# Index rows plus memory-mapped feature parts: features[kind][part][row] is the feature of a row
+def open_features(out_dir, kind="spec"):
+    index = _read_csv(os.path.join(out_dir, INDEX_NAME))
+    parts = {}
+    for row in index:
+        part = int(row["part"])
+        if part not in parts:
+            parts[part] = np.load(os.path.join(out_dir, f"{kind}-{part:05d}.npy"), mmap_mode="r")
+    return index, parts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract mel spectrograms / MFCC means from a train_audio/<class>/<file> tree")
+    parser.add_argument("root", help="train_audio directory")
+    parser.add_argument("out_dir")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=32)
+    parser.add_argument("--mfcc", action="store_true", help="also store the 40 MFCC means of the basic notebook")
+    parser.add_argument("--no-spectrograms", action="store_true")
+    parser.add_argument("--dtype", choices=["float16", "float32"], default="float16")
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--retry-failed", action="store_true")
+    args = parser.parse_args(argv)
+    extract(args.root, args.out_dir, workers=args.workers, chunk_size=args.chunk_size, spectrograms=not args.no_spectrograms,
+            mfcc=args.mfcc, dtype=args.dtype, duration=args.duration, retry_failed=args.retry_failed)
+
+
+if __name__ == "__main__":
+    main()
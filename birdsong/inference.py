@@ -0,0 +1,125 @@
+import threading
+import time
+
+import numpy as np
+
+
+# Direct-call inference for a Keras model. model.predict builds a dataset, runs callbacks and
+# a predict loop on every call, which dominates the latency of a batch of one. This holds a
+# tf.function with a fixed input signature (any batch size, fixed image shape), so it is traced
+# once; warmup() runs it at load time so the first request does not pay for the tracing.
+class CompiledPredictor:
+    def __init__(self, model, input_shape=(256, 256, 3), jit_compile=False, warmup=True):
+        import tensorflow as tf
+        self.model = model
+        self.input_shape = tuple(input_shape)
+        self.jit_compile = jit_compile
+        self._predict = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec((None,) + self.input_shape, tf.float32)],
+            jit_compile=jit_compile,
+        )
+        if warmup:
+            self.warmup()
+
+    def warmup(self, batch_size=1):
+        self(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+
+    # (batch, *input_shape) spectrograms -> (batch, classes) probabilities as numpy
+    def __call__(self, batch):
+        batch = np.asarray(batch, dtype=np.float32)
+        if batch.shape[1:] != self.input_shape:
+            raise ValueError(f"Expected input of shape (batch, {', '.join(map(str, self.input_shape))}), got {batch.shape}")
+        return self._predict(batch).numpy()
+
+    predict_batch = __call__
+
+
+# Same call interface for a SavedModel written by birdsong.export (serving signature
+# returning {"probabilities": ...}); the signature is already a concrete graph, so loading
+# it needs neither the Keras model code nor keras_cv.
+class SavedModelPredictor:
+    def __init__(self, export_dir, warmup=True):
+        import tensorflow as tf
+        self.export_dir = export_dir
+        self._module = tf.saved_model.load(export_dir)
+        self._serve = self._module.signatures["serving_default"]
+        _, inputs = self._serve.structured_input_signature
+        self._input_name, spec = next(iter(inputs.items()))
+        self.input_shape = tuple(spec.shape[1:])
+        if warmup:
+            self.warmup()
+
+    def warmup(self, batch_size=1):
+        self(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+
+    def __call__(self, batch):
+        batch = np.asarray(batch, dtype=np.float32)
+        return self._serve(**{self._input_name: batch})["probabilities"].numpy()
+
+    predict_batch = __call__
+
+
+# Same call interface for a .tflite model. Uses the standalone tflite_runtime interpreter when
+# it is installed (no TensorFlow needed on the serving host), else the one in TensorFlow.
+# Quantized (int8) inputs and outputs are converted with the tensors' scale and zero point,
+# so callers always pass float spectrograms and get float probabilities back.
+# The interpreter holds one set of tensors, so calls from several threads (Streamlit sessions
+# sharing one cached backend) take turns on it.
+class TFLitePredictor:
+    def __init__(self, model_path, num_threads=None, warmup=True):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+        self.model_path = model_path
+        self._interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self.input_shape = tuple(int(d) for d in self._input["shape"][1:])
+        self._batch_size = None
+        self._lock = threading.Lock()
+        if warmup:
+            self.warmup()
+
+    def warmup(self, batch_size=1):
+        self(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+
+    def _resize(self, batch_size):
+        if batch_size != self._batch_size:
+            self._interpreter.resize_tensor_input(self._input["index"], (batch_size,) + self.input_shape)
+            self._interpreter.allocate_tensors()
+            self._batch_size = batch_size
+
+    def __call__(self, batch):
+        batch = np.asarray(batch, dtype=np.float32)
+        scale, zero_point = self._input["quantization"]
+        if self._input["dtype"] != np.float32:
+            info = np.iinfo(self._input["dtype"])
+            batch = np.clip(np.rint(batch / scale + zero_point), info.min, info.max)
+        with self._lock:
+            self._resize(len(batch))
+            self._interpreter.set_tensor(self._input["index"], batch.astype(self._input["dtype"]))
+            self._interpreter.invoke()
+            # get_tensor returns a copy, so the next call cannot overwrite it
+            probabilities = self._interpreter.get_tensor(self._output["index"])
+        scale, zero_point = self._output["quantization"]
+        if self._output["dtype"] != np.float32:
+            probabilities = (probabilities.astype(np.float32) - zero_point) * scale
+        return probabilities
+
+    predict_batch = __call__
+
+
+# Per-call latency of predict_fn on `batch`, in milliseconds (p50, p99, mean)
+def measure_latency(predict_fn, batch, repeats=100, warmup=5):
+    for _ in range(warmup):
+        predict_fn(batch)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predict_fn(batch)
+        times.append((time.perf_counter() - start) * 1000)
+    times = np.asarray(times)
+    return {"p50_ms": float(np.percentile(times, 50)), "p99_ms": float(np.percentile(times, 99)), "mean_ms": float(times.mean())}
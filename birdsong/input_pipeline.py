@@ -0,0 +1,158 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from birdsong.melspec import melspectrogram_batch
+from birdsong.records import read_manifest, read_records_manifest, train_test_split
+
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+# Shared tail of every pipeline. Expensive per-example work is already done when this runs;
+# spectrograms are cached single-channel and only tiled to 3 channels after batching.
+#   cache: None, "memory", or a file path prefix for an on-disk cache
+#   deterministic: None means non-deterministic ordering for training, deterministic for eval
+def _finish(dataset, training, batch_size, shuffle_buffer, cache, deterministic, prefetch, channels, seed, batch_map=None):
+    if cache:
+        dataset = dataset.cache("" if cache == "memory" else cache)
+    if training and shuffle_buffer:
+        dataset = dataset.shuffle(shuffle_buffer, seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.batch(batch_size, drop_remainder=training, num_parallel_calls=AUTOTUNE, deterministic=deterministic)
+    if batch_map is not None:
+        dataset = dataset.map(batch_map, num_parallel_calls=AUTOTUNE, deterministic=deterministic)
+    if channels == 3:
+        dataset = dataset.map(lambda x, y: (tf.image.grayscale_to_rgb(x), y), num_parallel_calls=AUTOTUNE, deterministic=deterministic)
+    if prefetch:
+        dataset = dataset.prefetch(prefetch)
+    return dataset
+
+
+# Pipeline over raw audio files: decode and spectrogram in parallel tf.data workers.
+# Yields (spectrogram float32 (batch, img, img, channels), label int64).
+def audio_dataset(files, labels, training=False, batch_size=64, shuffle_buffer=1024, cache=None, deterministic=None,
+                  prefetch=AUTOTUNE, channels=3, seed=None, **frontend_kwargs):
+    if deterministic is None:
+        deterministic = not training
+    img_size = frontend_kwargs.get("img_size", 256)
+
+    def load(path):
+        return melspectrogram_batch([path.decode("utf-8")], **frontend_kwargs)[0]
+
+    def preprocess(path, label):
+        spectrogram = tf.numpy_function(load, [path], tf.float32)
+        spectrogram.set_shape((img_size, img_size))
+        return spectrogram[..., None], label
+
+    dataset = tf.data.Dataset.from_tensor_slices((list(files), np.asarray(labels, dtype=np.int64)))
+    if training:
+        # Shuffling the file list is free and decorrelates what ends up in the cache
+        dataset = dataset.shuffle(len(files), seed=seed, reshuffle_each_iteration=not cache)
+    dataset = dataset.map(preprocess, num_parallel_calls=AUTOTUNE, deterministic=deterministic)
+    # Unreadable files are dropped (with a logged warning) instead of ending the epoch
+    dataset = dataset.ignore_errors(log_warning=True)
+    return _finish(dataset, training, batch_size, shuffle_buffer, cache, deterministic, prefetch, channels, seed)
+
+
+# Batched parser for precomputed shards: one vectorized parse per batch instead of per example
+def make_batch_parser(shape, dtype="float16"):
+    features = {
+        "spectrogram": tf.io.FixedLenFeature([], tf.string),
+        "label": tf.io.FixedLenFeature([], tf.int64),
+    }
+
+    def parse(serialized):
+        examples = tf.io.parse_example(serialized, features)
+        spectrograms = tf.io.decode_raw(examples["spectrogram"], tf.dtypes.as_dtype(dtype))
+        spectrograms = tf.cast(tf.reshape(spectrograms, [-1] + list(shape)), tf.float32)
+        return spectrograms, examples["label"]
+
+    return parse
+
+
+# Pipeline over TFRecord shards written by birdsong.records: parallel interleave across
+# shard files, optional cache of the serialized records, shuffle, batch, vectorized parse.
+def records_dataset(records_dir, split="train", training=None, batch_size=64, shuffle_buffer=4096, cache=None, cycle_length=8,
+                    deterministic=None, prefetch=AUTOTUNE, channels=3, seed=None):
+    if training is None:
+        training = split == "train"
+    if deterministic is None:
+        deterministic = not training
+    manifest = read_records_manifest(records_dir)["splits"][split]
+    files = [os.path.join(records_dir, name) for name in manifest["files"]]
+
+    dataset = tf.data.Dataset.from_tensor_slices(files)
+    if training:
+        dataset = dataset.shuffle(len(files), seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.interleave(tf.data.TFRecordDataset, cycle_length=min(len(files), cycle_length),
+                                 num_parallel_calls=AUTOTUNE, deterministic=deterministic)
+    parse = make_batch_parser(manifest["shape"], manifest["dtype"])
+    return _finish(dataset, training, batch_size, shuffle_buffer, cache, deterministic, prefetch, channels, seed, batch_map=parse)
+
+
+# Train and eval pipelines from an audio.csv manifest, split like the training notebook
+def build_datasets(manifest, audio_root=None, train_fraction=0.9, split_seed=123, **options):
+    files, labels, classes = read_manifest(manifest, audio_root=audio_root)
+    (train_files, train_labels), (test_files, test_labels) = train_test_split(files, labels, train_fraction, split_seed)
+    eval_options = {**options, "cache": "memory" if options.get("cache") else None}
+    train = audio_dataset(train_files, train_labels, training=True, **options)
+    test = audio_dataset(test_files, test_labels, training=False, **eval_options)
+    return train, test, classes
+
+
+# Train and eval pipelines from precomputed shards
+def build_records_datasets(records_dir, **options):
+    train = records_dataset(records_dir, split="train", training=True, **options)
+    test = records_dataset(records_dir, split="test", training=False, **{**options, "cache": "memory" if options.get("cache") else None})
+    return train, test, read_records_manifest(records_dir)["classes"]
+
+
+# Throughput of a dataset in examples per second; the first `warmup` batches (pipeline
+# start-up, autotuning) are not timed
+def benchmark(dataset, steps=None, warmup=1):
+    iterator = iter(dataset)
+    for _ in range(warmup):
+        next(iterator, None)
+    examples = 0
+    batches = 0
+    start = time.perf_counter()
+    for x, _ in iterator:
+        examples += int(x.shape[0])
+        batches += 1
+        if steps is not None and batches >= steps:
+            break
+    elapsed = time.perf_counter() - start
+    return {"examples": examples, "batches": batches, "seconds": elapsed,
+            "examples_per_second": examples / elapsed if elapsed > 0 else float("nan")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the training input pipeline")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--manifest", help="audio.csv listing raw training audio")
+    source.add_argument("--records", help="directory of shards written by birdsong.records")
+    parser.add_argument("--audio-root")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--shuffle-buffer", type=int, default=1024)
+    parser.add_argument("--cache", help="'memory' or a cache file path prefix")
+    parser.add_argument("--deterministic", action="store_true")
+    parser.add_argument("--steps", type=int, default=None)
+    parser.add_argument("--epochs", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    options = dict(batch_size=args.batch_size, shuffle_buffer=args.shuffle_buffer, cache=args.cache,
+                   deterministic=True if args.deterministic else None)
+    if args.records:
+        train, _, _ = build_records_datasets(args.records, **options)
+    else:
+        train, _, _ = build_datasets(args.manifest, audio_root=args.audio_root, **options)
+    for epoch in range(1, args.epochs + 1):
+        result = benchmark(train, steps=args.steps)
+        print(f"epoch {epoch}: {result['examples']} examples in {result['seconds']:.1f}s "
+              f"({result['examples_per_second']:.1f} examples/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import numpy as np
+import tensorflow as tf
+
+from birdsong.melspec import frontend_geometry, get_plan, lanczos_matrix
+
+
+# In-graph equivalent of audio_to_melspectrogram for fixed-length waveforms:
+# (batch, samples) float32 at sr -> (batch, img_size, img_size, 1) in 0-255
+@tf.keras.utils.register_keras_serializable(package="birdsong")
+class MelSpectrogram(tf.keras.layers.Layer):
+    def __init__(self, sr=22050, n_fft=2048, hop_length=512, n_mels=128, duration=5, img_size=256, amin=1e-10, top_db=80.0, geometry="resize", **kwargs):
+        super().__init__(**kwargs)
+        self.sr = sr
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_mels = n_mels
+        self.duration = duration
+        self.img_size = img_size
+        self.amin = amin
+        self.top_db = top_db
+        self.geometry = geometry
+
+    def build(self, input_shape):
+        samples = input_shape[-1] or int(self.duration * self.sr)
+        n_mels, self._hop = frontend_geometry(samples, self.n_mels, self.hop_length, self.img_size, self.geometry)
+        frames = 1 + samples // self._hop
+        plan = get_plan(self.sr, self.n_fft, self._hop, n_mels)
+        # Same window, filterbank and resize weights as the numpy front end
+        self._window = tf.constant(plan.window)
+        self._mel_basis = tf.constant(np.ascontiguousarray(plan.mel_basis.T))
+        self._resize = (n_mels, frames) != (self.img_size, self.img_size)
+        if self._resize:
+            self._rows = tf.constant(lanczos_matrix(n_mels, self.img_size))
+            self._cols = tf.constant(lanczos_matrix(frames, self.img_size))
+        super().build(input_shape)
+
+    def call(self, waveform):
+        pad = self.n_fft // 2
+        y = tf.pad(tf.cast(waveform, tf.float32), [[0, 0], [pad, pad]])
+        stft = tf.signal.stft(
+            y, frame_length=self.n_fft, frame_step=self._hop, fft_length=self.n_fft,
+            window_fn=lambda length, dtype: self._window
+        )
+        power = tf.math.square(tf.math.real(stft)) + tf.math.square(tf.math.imag(stft))
+        mel = tf.transpose(tf.matmul(power, self._mel_basis), [0, 2, 1])
+
+        # power_to_db(ref=np.max, top_db=80) per clip
+        log10 = tf.math.log(tf.constant(10.0))
+        mel_db = 10.0 * tf.math.log(tf.maximum(self.amin, mel)) / log10
+        ref = tf.reduce_max(mel, axis=[1, 2], keepdims=True)
+        mel_db -= 10.0 * tf.math.log(tf.maximum(self.amin, ref)) / log10
+        mel_db = tf.maximum(mel_db, tf.reduce_max(mel_db, axis=[1, 2], keepdims=True) - self.top_db)
+
+        # Per-clip min-max to 0-255
+        lo = tf.reduce_min(mel_db, axis=[1, 2], keepdims=True)
+        span = tf.reduce_max(mel_db, axis=[1, 2], keepdims=True) - lo
+        mel_norm = 255.0 * (mel_db - lo) / tf.where(span > 0, span, tf.ones_like(span))
+
+        # Lanczos resize as two matmuls (skipped for the direct geometry)
+        image = mel_norm
+        if self._resize:
+            image = tf.einsum("ij,bjk,lk->bil", self._rows, mel_norm, self._cols)
+        return image[..., None]
+
+    def compute_output_shape(self, input_shape):
+        return (input_shape[0], self.img_size, self.img_size, 1)
+
+    def get_config(self):
+        config = super().get_config()
+        config.update({
+            "sr": self.sr, "n_fft": self.n_fft, "hop_length": self.hop_length, "n_mels": self.n_mels,
+            "duration": self.duration, "img_size": self.img_size, "amin": self.amin, "top_db": self.top_db,
+            "geometry": self.geometry,
+        })
+        return config
+
+
+# Repeats a single-channel spectrogram to the 3 channels EfficientNetV2B0 expects,
+# so only one channel is ever stored or fed to the model
+@tf.keras.utils.register_keras_serializable(package="birdsong")
+class ChannelTile(tf.keras.layers.Layer):
+    def __init__(self, channels=3, **kwargs):
+        super().__init__(**kwargs)
+        self.channels = channels
+
+    def call(self, images):
+        return tf.tile(images, [1, 1, 1, self.channels])
+
+    def compute_output_shape(self, input_shape):
+        return tuple(input_shape[:-1]) + (input_shape[-1] * self.channels,)
+
+    def get_config(self):
+        config = super().get_config()
+        config.update({"channels": self.channels})
+        return config
@@ -0,0 +1,160 @@
+from functools import lru_cache
+
+import numpy as np
+
+from birdsong.decode import load_audio
+
+
+# Lanczos kernel exactly as PIL evaluates it for Image.LANCZOS
+def _lanczos(x):
+    x = np.asarray(x, dtype=np.float64)
+    return np.where((x >= -3) & (x < 3), np.sinc(x) * np.sinc(x / 3), 0.0)
+
+
+# Matrix that reproduces PIL's Image.resize(..., Image.LANCZOS) along one axis,
+# so resizing a batch becomes two matmuls instead of a PIL round trip per clip
+@lru_cache(maxsize=32)
+def lanczos_matrix(in_size, out_size):
+    scale = in_size / out_size
+    filterscale = max(scale, 1.0)
+    support = 3.0 * filterscale
+    weights = np.zeros((out_size, in_size), dtype=np.float64)
+    for i in range(out_size):
+        center = (i + 0.5) * scale
+        lo = max(int(center - support + 0.5), 0)
+        hi = min(int(center + support + 0.5), in_size)
+        w = _lanczos((np.arange(lo, hi) - center + 0.5) / filterscale)
+        total = w.sum()
+        if total != 0:
+            w = w / total
+        weights[i, lo:hi] = w
+    weights = weights.astype(np.float32)
+    weights.flags.writeable = False
+    return weights
+
+
+# Everything about the front end that depends only on its parameters
+class FrontEndPlan:
+    def __init__(self, sr, n_fft, hop_length, n_mels):
+        self.sr = sr
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_mels = n_mels
+        # librosa (and numba behind it) is only imported when the first plan is built
+        import librosa
+        self.window = librosa.filters.get_window("hann", n_fft, fftbins=True).astype(np.float32)
+        self.mel_basis = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels, fmax=sr // 2)
+        self.window.flags.writeable = False
+        self.mel_basis.flags.writeable = False
+
+    # Centered, zero-padded STFT power (same framing as librosa.stft) -> (N, 1 + n_fft // 2, frames).
+    # With center=False, y is framed as is (used to continue an STFT across stream blocks).
+    def power_spectrum(self, y, center=True):
+        if center:
+            pad = self.n_fft // 2
+            y = np.pad(y, [(0, 0)] * (y.ndim - 1) + [(pad, pad)])
+        frames = np.lib.stride_tricks.sliding_window_view(y, self.n_fft, axis=-1)[..., ::self.hop_length, :]
+        spec = np.fft.rfft(frames * self.window, axis=-1)
+        power = spec.real ** 2 + spec.imag ** 2
+        return np.swapaxes(power, -1, -2).astype(np.float32)
+
+
+# Plans are built once per parameter set; the LRU bound covers callers that vary them
+@lru_cache(maxsize=8)
+def get_plan(sr=22050, n_fft=2048, hop_length=512, n_mels=128):
+    return FrontEndPlan(sr, n_fft, hop_length, n_mels)
+
+
+# Decode paths (or pass through arrays) as mono float32 waveforms
+def load_waveforms(sources, sr=22050, duration=5):
+    max_len = int(duration * sr) if duration else None
+    waveforms = []
+    for source in sources:
+        if isinstance(source, np.ndarray):
+            y = np.asarray(source, dtype=np.float32)[:max_len]
+        else:
+            y = load_audio(source, sr=sr, duration=duration)
+        waveforms.append(y)
+    return waveforms
+
+
+# Stacked STFT and a single mel projection for equally long clips -> (N, n_mels, frames)
+def mel_power_batch(waveforms, sr=22050, n_fft=2048, hop_length=512, n_mels=128):
+    plan = get_plan(sr, n_fft, hop_length, n_mels)
+    return np.matmul(plan.mel_basis, plan.power_spectrum(np.stack(waveforms)))
+
+
+# Per-clip power_to_db(ref=np.max), 0-255 min-max and Lanczos resize -> (N, img_size, img_size)
+def power_to_image(mel_power, img_size=256, amin=1e-10, top_db=80.0):
+    ref = np.max(mel_power, axis=(1, 2), keepdims=True)
+    mel_db = 10.0 * np.log10(np.maximum(amin, mel_power))
+    mel_db -= 10.0 * np.log10(np.maximum(amin, ref))
+    mel_db = np.maximum(mel_db, mel_db.max(axis=(1, 2), keepdims=True) - top_db)
+
+    lo = mel_db.min(axis=(1, 2), keepdims=True)
+    span = mel_db.max(axis=(1, 2), keepdims=True) - lo
+    mel_norm = 255 * (mel_db - lo) / np.where(span > 0, span, 1)
+
+    mel_norm = mel_norm.astype(np.float32)
+    n_mels, frames = mel_norm.shape[1:]
+    if (n_mels, frames) == (img_size, img_size):
+        return mel_norm
+    rows = lanczos_matrix(n_mels, img_size)
+    cols = lanczos_matrix(frames, img_size)
+    return np.matmul(np.matmul(rows, mel_norm), cols.T)
+
+
+# Mel bins and hop for a clip of `samples` samples. "resize" keeps the given values
+# (the geometry the checkpoints were trained on); "direct" picks n_mels = img_size and
+# the hop that yields exactly img_size centered frames, so no resize is needed.
+def frontend_geometry(samples, n_mels=128, hop_length=512, img_size=256, geometry="resize"):
+    if geometry == "resize":
+        return n_mels, hop_length
+    if geometry != "direct":
+        raise ValueError(f"Unknown geometry {geometry!r}, expected 'resize' or 'direct'")
+    hop_length = max(samples // (img_size - 1), 1)
+    if 1 + samples // hop_length != img_size:
+        raise ValueError(f"No hop length gives {img_size} frames for {samples} samples")
+    return img_size, hop_length
+
+
+# Batched version of audio_to_melspectrogram: N paths or waveforms -> (N, img_size, img_size).
+# Spectrograms stay single-channel; use to_three_channels (or the ChannelTile layer) for the model.
+def melspectrogram_batch(sources, sr=22050, n_fft=2048, hop_length=512, n_mels=128, duration=5, img_size=256, chunk_size=64, geometry="resize"):
+    waveforms = load_waveforms(sources, sr=sr, duration=duration)
+    images = np.empty((len(waveforms), img_size, img_size), dtype=np.float32)
+
+    # Clips of equal length (the usual case for fixed 5 second clips) share one STFT pass
+    groups = {}
+    for i, y in enumerate(waveforms):
+        groups.setdefault(len(y), []).append(i)
+
+    for samples, indices in groups.items():
+        group_mels, group_hop = frontend_geometry(samples, n_mels, hop_length, img_size, geometry)
+        for start in range(0, len(indices), chunk_size):
+            chunk = indices[start:start + chunk_size]
+            power = mel_power_batch([waveforms[i] for i in chunk], sr=sr, n_fft=n_fft, hop_length=group_hop, n_mels=group_mels)
+            images[chunk] = power_to_image(power, img_size=img_size)
+    return images
+
+
+# Read-only 3-channel view of single-channel spectrograms, without copying them
+def to_three_channels(images):
+    images = np.asarray(images)
+    return np.broadcast_to(images[..., None], images.shape + (3,))
+
+
+# How far the "direct" geometry is from the "resize" output the checkpoints were trained on.
+# With predict_fn (batch -> probabilities) it also reports how often the top-1 class agrees.
+def compare_geometries(sources, predict_fn=None, sr=22050, duration=5, **frontend_kwargs):
+    waveforms = load_waveforms(sources, sr=sr, duration=duration)
+    resized = melspectrogram_batch(waveforms, sr=sr, duration=duration, geometry="resize", **frontend_kwargs)
+    direct = melspectrogram_batch(waveforms, sr=sr, duration=duration, geometry="direct", **frontend_kwargs)
+    diff = np.abs(resized - direct)
+    report = {"mean_abs_diff": float(diff.mean()), "max_abs_diff": float(diff.max())}
+    if predict_fn is not None:
+        p_resized = np.asarray(predict_fn(resized))
+        p_direct = np.asarray(predict_fn(direct))
+        report["top1_agreement"] = float(np.mean(p_resized.argmax(-1) == p_direct.argmax(-1)))
+        report["mean_abs_prob_diff"] = float(np.abs(p_resized - p_direct).mean())
+    return report
@@ -0,0 +1,175 @@
+import numpy as np
+import tensorflow as tf
+
+from birdsong.layers import ChannelTile, MelSpectrogram
+from birdsong.melspec import melspectrogram_batch
+
+
+# Load a training checkpoint (it still contains the keras_cv augmentation layers)
+def load_checkpoint(path):
+    from keras_cv.layers import RandomCutout
+    return tf.keras.models.load_model(path, custom_objects={"RandomCutout": RandomCutout})
+
+
+# Call `fn` on every tensor reference ({"class_name": "__keras_tensor__", ...}) in a layer config
+def _visit_tensors(obj, fn):
+    if isinstance(obj, dict):
+        if obj.get("class_name") == "__keras_tensor__":
+            fn(obj["config"]["keras_history"])
+        else:
+            for value in obj.values():
+                _visit_tensors(value, fn)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _visit_tensors(value, fn)
+
+
+# BatchNormalization (inference statistics) folded into the kernel and bias of the preceding
+# Conv2D / DepthwiseConv2D
+def _fold_conv_bn(conv, bn):
+    weights = conv.get_weights()
+    kernel = weights[0]
+    gamma = bn.gamma.numpy() if bn.scale else 1.0
+    beta = bn.beta.numpy() if bn.center else 0.0
+    scale = gamma / np.sqrt(bn.moving_variance.numpy() + bn.epsilon)
+    bias = weights[1] if conv.use_bias else np.zeros_like(scale)
+    if isinstance(conv, tf.keras.layers.DepthwiseConv2D):
+        # Output channel c * multiplier + m comes from input channel c
+        kernel = kernel * scale.reshape(kernel.shape[-2], kernel.shape[-1])
+    else:
+        kernel = kernel * scale
+    bias = (bias - bn.moving_mean.numpy()) * scale + beta
+    return [kernel.astype(np.float32), bias.astype(np.float32)]
+
+
+# Rebuild a Functional model for inference only: every BatchNormalization that directly follows
+# a convolution is folded into it, and Dropout layers are removed. Returns the new model and
+# the number of folded and dropped layers.
+def fold_batchnorm(model):
+    config = model.get_config()
+    layers = {layer["name"]: layer for layer in config["layers"]}
+    # A single output is stored as [name, node, tensor] rather than a list of them
+    outputs = [config["output_layers"]] if isinstance(config["output_layers"][0], str) else config["output_layers"]
+
+    consumers = {name: 0 for name in layers}
+    def count(history):
+        consumers[history[0]] += 1
+    for layer in config["layers"]:
+        _visit_tensors(layer["inbound_nodes"], count)
+    for name, _, _ in outputs:
+        consumers[name] += 1
+
+    # Removed layer name -> the layer whose output replaces it
+    replaced = {}
+    folded = {}
+    for layer in config["layers"]:
+        if layer["class_name"] not in ("BatchNormalization", "Dropout") or len(layer["inbound_nodes"]) != 1:
+            continue
+        inputs = []
+        _visit_tensors(layer["inbound_nodes"], inputs.append)
+        if len(inputs) != 1:
+            continue
+        source = inputs[0][0]
+        if layer["class_name"] == "BatchNormalization":
+            parent = layers[source]
+            if (parent["class_name"] not in ("Conv2D", "DepthwiseConv2D") or consumers[source] != 1
+                    or parent["config"].get("activation", "linear") != "linear"
+                    or layer["config"]["axis"] not in (-1, 3, [3], [-1])):
+                continue
+            parent["config"]["use_bias"] = True
+            folded[source] = layer["name"]
+        replaced[layer["name"]] = replaced.get(source, source)
+
+    def rewire(history):
+        while history[0] in replaced:
+            history[0] = replaced[history[0]]
+    config["layers"] = [layer for layer in config["layers"] if layer["name"] not in replaced]
+    for layer in config["layers"]:
+        _visit_tensors(layer["inbound_nodes"], rewire)
+    for history in outputs:
+        rewire(history)
+
+    inference_model = tf.keras.Model.from_config(config)
+    for layer in inference_model.layers:
+        original = model.get_layer(layer.name)
+        if layer.name in folded:
+            layer.set_weights(_fold_conv_bn(original, model.get_layer(folded[layer.name])))
+        elif layer.weights:
+            layer.set_weights(original.get_weights())
+    inference_model.trainable = False
+    dropped = len(replaced) - len(folded)
+    return inference_model, len(folded), dropped
+
+
+# Inference-only classifier from a training checkpoint: input goes straight into the
+# EfficientNetV2B0 base (BatchNorm folded, Dropout removed), global pooling and the softmax
+# head. The RandomFlip / RandomCutout augmentation layers are left out, so loading the result
+# needs neither keras_cv nor custom_objects.
+def strip_for_inference(model):
+    base = next(layer for layer in model.layers if isinstance(layer, tf.keras.Model))
+    pooling = next(layer for layer in model.layers if isinstance(layer, tf.keras.layers.GlobalAveragePooling2D))
+    head = model.layers[-1]
+    folded_base, _, _ = fold_batchnorm(base)
+
+    inputs = tf.keras.Input(shape=model.input_shape[1:], name="input_layer")
+    x = folded_base(inputs, training=False)
+    x = tf.keras.layers.GlobalAveragePooling2D(name=pooling.name)(x)
+    outputs = tf.keras.layers.Dense(head.units, activation=head.activation, name=head.name)(x)
+    inference_model = tf.keras.Model(inputs, outputs, name="inference_classifier")
+    inference_model.get_layer(head.name).set_weights(head.get_weights())
+    return inference_model
+
+
+# Wrap a 3-channel spectrogram model so it takes single-channel (img_size, img_size, 1) input
+def build_spectrogram_model(model, img_size=256):
+    inputs = tf.keras.Input(shape=(img_size, img_size, 1), name="spectrogram")
+    outputs = model(ChannelTile(name="channel_tile")(inputs))
+    return tf.keras.Model(inputs, outputs, name="spectrogram_classifier")
+
+
+# Wrap a spectrogram model so it takes raw waveforms of `duration` seconds at `sr`
+def build_waveform_model(model, sr=22050, duration=5, **frontend_kwargs):
+    samples = int(duration * sr)
+    inputs = tf.keras.Input(shape=(samples,), name="waveform")
+    x = MelSpectrogram(sr=sr, duration=duration, name="melspectrogram", **frontend_kwargs)(inputs)
+    outputs = model(ChannelTile(name="channel_tile")(x))
+    return tf.keras.Model(inputs, outputs, name="waveform_classifier")
+
+
+# Largest absolute difference (0-255 scale) between the in-graph and numpy front ends
+def frontend_difference(waveforms, sr=22050, duration=5, **frontend_kwargs):
+    waveforms = np.asarray(waveforms, dtype=np.float32)
+    layer = MelSpectrogram(sr=sr, duration=duration, **frontend_kwargs)
+    in_graph = layer(tf.constant(waveforms)).numpy()[..., 0]
+    reference = melspectrogram_batch(list(waveforms), sr=sr, duration=duration, **frontend_kwargs)
+    return float(np.abs(in_graph - reference).max())
+
+
+# Save a SavedModel whose serving signature takes one float32 tensor of input_shape
+def save_serving_model(model, export_dir, input_shape, input_name):
+    module = tf.Module()
+    module.model = model
+
+    @tf.function(input_signature=[tf.TensorSpec(input_shape, tf.float32, name=input_name)])
+    def serve(x):
+        return {"probabilities": module.model(x, training=False)}
+
+    module.serve = serve
+    tf.saved_model.save(module, export_dir, signatures={"serving_default": serve})
+    return export_dir
+
+
+def export_waveform_model(checkpoint_path, export_dir, sr=22050, duration=5):
+    model = build_waveform_model(strip_for_inference(load_checkpoint(checkpoint_path)), sr=sr, duration=duration)
+    return save_serving_model(model, export_dir, [None, int(duration * sr)], "waveform")
+
+
+def export_spectrogram_model(checkpoint_path, export_dir, img_size=256):
+    model = build_spectrogram_model(strip_for_inference(load_checkpoint(checkpoint_path)), img_size=img_size)
+    return save_serving_model(model, export_dir, [None, img_size, img_size, 1], "spectrogram")
+
+
+# SavedModel of the stripped classifier itself, taking the 3-channel spectrograms the app builds
+def export_inference_model(checkpoint_path, export_dir, img_size=256):
+    model = strip_for_inference(load_checkpoint(checkpoint_path))
+    return save_serving_model(model, export_dir, [None, img_size, img_size, 3], "spectrogram")
@@ -0,0 +1,146 @@
+import argparse
+import csv
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import tensorflow as tf
+
+from birdsong.melspec import melspectrogram_batch
+from birdsong.species import load_species
+
+MANIFEST_NAME = "manifest.json"
+
+
+# Files and integer labels from an audio.csv-style manifest ("audio" column of
+# .../train_audio/<class>/<file> paths). audio_root re-roots the paths at a local
+# train_audio directory. classes defaults to the species table, whose order is the model's
+# output order, so labels stay aligned with the checkpoint even when a class has no rows here.
+def read_manifest(csv_path, audio_root=None, classes=None, column="audio"):
+    with open(csv_path, newline="") as f:
+        paths = [row[column] for row in csv.DictReader(f)]
+    if audio_root:
+        paths = [os.path.join(audio_root, *path.replace("\\", "/").split("/")[-2:]) for path in paths]
+    class_names = [os.path.basename(os.path.dirname(path)) for path in paths]
+    classes = [str(name) for name in (classes if classes is not None else load_species().labels)]
+    index = {name: i for i, name in enumerate(classes)}
+    unknown = sorted(set(class_names) - set(index))
+    if unknown:
+        raise ValueError(f"{csv_path} has classes missing from the class list: {', '.join(unknown)}")
+    labels = [index[name] for name in class_names]
+    return paths, labels, classes
+
+
+# Same shuffle and 90/10 split as the training notebook (seeded shuffles of both lists)
+def train_test_split(files, labels, train_fraction=0.9, seed=123):
+    files, labels = list(files), list(labels)
+    random.seed(seed)
+    random.shuffle(files)
+    random.seed(seed)
+    random.shuffle(labels)
+    n_train = int(len(files) * train_fraction)
+    return (files[:n_train], labels[:n_train]), (files[n_train:], labels[n_train:])
+
+
+def _example(spectrogram, label):
+    return tf.train.Example(features=tf.train.Features(feature={
+        "spectrogram": tf.train.Feature(bytes_list=tf.train.BytesList(value=[spectrogram.tobytes()])),
+        "label": tf.train.Feature(int64_list=tf.train.Int64List(value=[int(label)])),
+    }))
+
+
+# Worker: compute one shard's spectrograms in batches and write them as a TFRecord file.
+# Files that fail to decode are skipped and returned so the caller can report them.
+def _write_shard(path, files, labels, dtype, chunk_size, frontend_kwargs):
+    written = 0
+    failed = []
+    with tf.io.TFRecordWriter(path) as writer:
+        for start in range(0, len(files), chunk_size):
+            chunk = list(zip(files[start:start + chunk_size], labels[start:start + chunk_size]))
+            try:
+                specs = melspectrogram_batch([f for f, _ in chunk], **frontend_kwargs)
+                results = list(zip(specs, chunk))
+            except Exception:
+                # Retry one by one to isolate the unreadable files
+                results = []
+                for item in chunk:
+                    try:
+                        results.append((melspectrogram_batch([item[0]], **frontend_kwargs)[0], item))
+                    except Exception as e:
+                        failed.append((item[0], f"{type(e).__name__}: {e}"))
+            for spec, (_, label) in results:
+                writer.write(_example(spec.astype(dtype), label).SerializeToString())
+                written += 1
+    return path, written, failed
+
+
+# Precompute spectrograms for (files, labels) once, in parallel, into num_shards TFRecord
+# files <out_dir>/<split>-NNNNN-of-MMMMM.tfrecord. Spectrograms are stored single-channel
+# as float16 by default (uint8 is smaller but clips the Lanczos overshoot outside 0-255).
+def write_shards(files, labels, out_dir, split="train", num_shards=16, workers=None, dtype="float16", chunk_size=32, **frontend_kwargs):
+    os.makedirs(out_dir, exist_ok=True)
+    img_size = frontend_kwargs.get("img_size", 256)
+    num_shards = max(1, min(num_shards, len(files)))
+    shards = []
+    for i in range(num_shards):
+        path = os.path.join(out_dir, f"{split}-{i:05d}-of-{num_shards:05d}.tfrecord")
+        shards.append((path, files[i::num_shards], labels[i::num_shards]))
+
+    count = 0
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_write_shard, path, shard_files, shard_labels, dtype, chunk_size, frontend_kwargs)
+                   for path, shard_files, shard_labels in shards]
+        for done, future in enumerate(as_completed(futures), 1):
+            path, written, shard_failed = future.result()
+            count += written
+            failed.extend(shard_failed)
+            print(f"[{done}/{num_shards}] {os.path.basename(path)}: {written} examples")
+
+    for path, error in failed:
+        print(f"Skipped {path}: {error}")
+    return {"split": split, "files": [os.path.basename(path) for path, _, _ in shards], "count": count,
+            "shape": [img_size, img_size, 1], "dtype": dtype, "skipped": len(failed)}
+
+
+def write_manifest(out_dir, splits, classes, frontend_kwargs):
+    manifest = {"classes": list(classes), "frontend": frontend_kwargs, "splits": {s["split"]: s for s in splits}}
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_records_manifest(records_dir):
+    with open(os.path.join(records_dir, MANIFEST_NAME)) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute training spectrograms into sharded TFRecords")
+    parser.add_argument("manifest", help="audio.csv with an 'audio' column of train_audio/<class>/<file> paths")
+    parser.add_argument("out_dir")
+    parser.add_argument("--audio-root", help="local train_audio directory to re-root the manifest paths at")
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--train-fraction", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=123)
+    parser.add_argument("--dtype", choices=["float16", "uint8"], default="float16")
+    parser.add_argument("--duration", type=float, default=5)
+    args = parser.parse_args(argv)
+
+    files, labels, classes = read_manifest(args.manifest, audio_root=args.audio_root)
+    train, test = train_test_split(files, labels, args.train_fraction, args.seed)
+    frontend_kwargs = {"duration": args.duration}
+    splits = []
+    for split, (split_files, split_labels) in (("train", train), ("test", test)):
+        if split_files:
+            shards = max(1, round(args.shards * len(split_files) / len(files)))
+            splits.append(write_shards(split_files, split_labels, args.out_dir, split=split, num_shards=shards,
+                                       workers=args.workers, dtype=args.dtype, **frontend_kwargs))
+    write_manifest(args.out_dir, splits, classes, frontend_kwargs)
+    print(f"Wrote {sum(s['count'] for s in splits)} examples to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from birdsong.engine import Classifier, top_species
+from birdsong.melspec import to_three_channels
+
+PCM_DTYPES = {"float32": np.float32, "int16": np.int16}
+
+
+# Coalesces single-example requests into batches for one forward pass. submit() queues an
+# input and returns a Future; a worker thread takes the first waiting input, then keeps
+# collecting until max_batch_size inputs or max_wait seconds after the first, runs predict_fn
+# once on the stacked batch and hands each row back to its Future.
+class MicroBatcher:
+    def __init__(self, predict_fn, max_batch_size=16, max_wait=0.01):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.items = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, x):
+        future = Future()
+        self._queue.put((x, future))
+        return future
+
+    def predict(self, x, timeout=None):
+        return self.submit(x).result(timeout=timeout)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def stats(self):
+        return {"batches": self.batches, "items": self.items,
+                "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+                "queued": self._queue.qsize()}
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Finish this batch, then stop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            try:
+                probabilities = self.predict_fn(np.stack([x for x, _ in batch]))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.items += len(batch)
+            for (_, future), row in zip(batch, probabilities):
+                future.set_result(row)
+
+
+# Mono float32 waveform at sr from a raw PCM request body
+def decode_pcm(body, sample_rate, dtype="int16", channels=1, sr=22050):
+    if dtype not in PCM_DTYPES:
+        raise ValueError(f"Unsupported PCM dtype {dtype!r}, expected one of {sorted(PCM_DTYPES)}")
+    y = np.frombuffer(body, dtype=PCM_DTYPES[dtype]).astype(np.float32)
+    if dtype == "int16":
+        y /= 32768.0
+    if channels > 1:
+        y = y[:len(y) - len(y) % channels].reshape(-1, channels).mean(axis=1)
+    if sample_rate != sr:
+        import soxr
+        y = soxr.resample(y, sample_rate, sr, quality="HQ")
+    return np.ascontiguousarray(y, dtype=np.float32)
+
+
+# POST /classify with an audio file as the body (WAV, FLAC, OGG, MP3), or raw PCM with
+# ?format=pcm&sample_rate=48000[&dtype=int16|float32][&channels=1]; ?top_k=5 sets the number
+# of species returned. GET /health and GET /stats report liveness and batching counters.
+class ClassifyHandler(BaseHTTPRequestHandler):
+    classifier = None
+    batcher = None
+    request_timeout = 60
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/stats":
+            self._send_json(200, self.batcher.stats())
+        else:
+            self._send_json(404, {"error": f"Unknown path {path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/classify":
+            self._send_json(404, {"error": f"Unknown path {url.path}"})
+            return
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length", 0))
+        if length <= 0:
+            self._send_json(400, {"error": "Empty request body"})
+            return
+        body = self.rfile.read(length)
+        try:
+            top_k = int(query.get("top_k", 5))
+            if top_k < 1:
+                raise ValueError(f"top_k must be at least 1, got {top_k}")
+            if query.get("format") == "pcm":
+                source = decode_pcm(body, int(query["sample_rate"]), dtype=query.get("dtype", "int16"),
+                                    channels=int(query.get("channels", 1)))
+            else:
+                source = body
+            # Decode and spectrogram run on this request's thread; only the model is batched
+            spectrogram = self.classifier.spectrograms([source])[0]
+        except Exception as e:
+            self._send_json(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        try:
+            probabilities = self.batcher.predict(to_three_channels(spectrogram), timeout=self.request_timeout)
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._send_json(200, {"top": top_species(probabilities, k=top_k)})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=8000, classifier=None, max_batch_size=16, max_wait=0.01, verbose=False):
+    classifier = classifier or Classifier()
+    batcher = MicroBatcher(classifier.predict_batch, max_batch_size=max_batch_size, max_wait=max_wait)
+    handler = type("BoundClassifyHandler", (ClassifyHandler,), {"classifier": classifier, "batcher": batcher})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    server.batcher = batcher
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the bird sound classifier over HTTP with dynamic micro-batching")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--model", help="model path (default: BIRDSONG_MODEL, the inference export, or the checkpoint)")
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=10)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    classifier = Classifier(backend_config={"path": args.model} if args.model else None)
+    classifier.backend  # load and warm up before accepting requests
+    server = make_server(args.host, args.port, classifier, max_batch_size=args.max_batch_size,
+                         max_wait=args.max_wait_ms / 1000, verbose=args.verbose)
+    print(f"Serving on http://{args.host}:{args.port} (POST /classify, GET /health, GET /stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+
+
+if __name__ == "__main__":
+    main()
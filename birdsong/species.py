@@ -0,0 +1,86 @@
+import csv
+import os
+from functools import lru_cache
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SPECIES_CSV = os.path.join(DATA_DIR, "species.csv")
+DESCRIPTIONS_CSV = os.path.join(DATA_DIR, "species_descriptions.csv")
+
+
+def _read_columns(path, columns):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return [np.array([row[column] for row in rows], dtype=object) for column in columns]
+
+
+# Species metadata indexed by model output index: row i of species.csv describes output i.
+# Every field is one array, so table.common_names[top_indices] looks up a whole top-k at once.
+#   label: the class code the model was trained on (the train_audio directory name)
+#   code / common_name / scientific_name: shown to users
+# Descriptions are the bulk of the data and live in a second file that is only read the
+# first time one is asked for, so batch workers that only need labels never load them.
+class SpeciesTable:
+    def __init__(self, labels, common_names, scientific_names, codes, descriptions_path=None):
+        self.labels = labels
+        self.common_names = common_names
+        self.scientific_names = scientific_names
+        self.codes = codes
+        self.descriptions_path = descriptions_path
+        self._descriptions = None
+        self._index = None
+
+    @classmethod
+    def load(cls, path=SPECIES_CSV, descriptions_path=DESCRIPTIONS_CSV):
+        labels, common_names, scientific_names, codes = _read_columns(path, ["label", "common_name", "scientific_name", "code"])
+        return cls(labels, common_names, scientific_names, codes, descriptions_path=descriptions_path)
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def descriptions(self):
+        if self._descriptions is None:
+            if self.descriptions_path is None:
+                self._descriptions = np.full(len(self), "", dtype=object)
+            else:
+                labels, descriptions = _read_columns(self.descriptions_path, ["label", "description"])
+                if not np.array_equal(labels, self.labels):
+                    raise ValueError(f"{self.descriptions_path} does not list the species in model output order")
+                self._descriptions = descriptions
+        return self._descriptions
+
+    def label(self, index):
+        return self.labels[index]
+
+    def common_name(self, index):
+        return self.common_names[index]
+
+    def scientific_name(self, index):
+        return self.scientific_names[index]
+
+    def code(self, index):
+        return self.codes[index]
+
+    def description(self, index):
+        return self.descriptions[index]
+
+    # Output index of a class label
+    def index_of(self, label):
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index[label]
+
+    def row(self, index, description=False):
+        row = {"index": int(index), "label": self.labels[index], "code": self.codes[index],
+               "common_name": self.common_names[index], "scientific_name": self.scientific_names[index]}
+        if description:
+            row["description"] = self.descriptions[index]
+        return row
+
+
+# The species table shipped with the package, read once per process
+@lru_cache(maxsize=None)
+def load_species():
+    return SpeciesTable.load()
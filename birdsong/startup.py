@@ -0,0 +1,79 @@
+import argparse
+import importlib
+import sys
+import time
+
+import numpy as np
+
+# Third-party modules in the order a classification job first needs them
+HEAVY_MODULES = ["numpy", "soundfile", "soxr", "librosa", "tensorflow", "onnxruntime", "tflite_runtime", "streamlit"]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+# Cold-start breakdown of this (fresh) process: what importing the engine costs, what each heavy
+# dependency adds on top of what is already loaded, and the model load, warmup and first
+# classification. Returns (step, seconds or None if not installed) rows.
+def startup_report(audio=None, backend_config=None, modules=HEAVY_MODULES):
+    rows = []
+    already_loaded = [name for name in modules if name in sys.modules]
+    _, seconds = _timed(lambda: importlib.import_module("birdsong.engine"))
+    rows.append(("import birdsong.engine", seconds))
+    for name in modules:
+        if name in already_loaded:
+            continue
+        if name in sys.modules:
+            rows.append((f"import {name} (pulled in by birdsong.engine)", 0.0))
+            continue
+        try:
+            _, seconds = _timed(lambda: importlib.import_module(name))
+        except ImportError:
+            seconds = None
+        rows.append((f"import {name}", seconds))
+
+    from birdsong.engine import Classifier
+    from birdsong.backends import load_backend
+    backend, seconds = _timed(lambda: load_backend(backend_config, warmup=False))
+    rows.append((f"load model {backend!r}", seconds))
+    _, seconds = _timed(backend.warmup)
+    rows.append(("warmup (first call)", seconds))
+    classifier = Classifier(backend=backend)
+    if audio is None:
+        audio = np.zeros(5 * 22050, dtype=np.float32)
+    _, seconds = _timed(lambda: classifier.classify([audio]))
+    rows.append(("first classification (decode + spectrogram + model)", seconds))
+    _, seconds = _timed(lambda: classifier.classify([audio]))
+    rows.append(("second classification", seconds))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report the cold-start cost of imports and model loading. "
+                                                 "Run it as its own process: python -m birdsong.startup")
+    parser.add_argument("--model", help="model path (default: BIRDSONG_MODEL, the inference export, or the checkpoint)")
+    parser.add_argument("--backend")
+    parser.add_argument("--audio", help="audio file to classify (default: 5 s of silence)")
+    parser.add_argument("--modules", nargs="+", default=HEAVY_MODULES)
+    args = parser.parse_args(argv)
+
+    config = None
+    if args.model:
+        config = {"path": args.model}
+        if args.backend:
+            config["backend"] = args.backend
+    total = 0.0
+    for step, seconds in startup_report(audio=args.audio, backend_config=config, modules=args.modules):
+        if seconds is None:
+            print(f"{step:<60} not installed")
+            continue
+        total += seconds
+        print(f"{step:<60} {seconds * 1000:9.1f} ms")
+    print(f"{'total':<60} {total * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import random
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.python.framework.convert_to_constants import convert_variables_to_constants_v2
+
+from birdsong.extract import list_train_audio
+from birdsong.inference import CompiledPredictor, TFLitePredictor
+from birdsong.melspec import melspectrogram_batch, to_three_channels
+from birdsong.model import load_checkpoint, strip_for_inference
+from birdsong.species import load_species
+
+VARIANTS = ("float32", "float16", "int8")
+
+
+# Single-channel spectrograms for a list of audio files, computed in chunks; the 3-channel
+# model input is only built per batch, so the whole set never exists three times over
+def spectrograms_for(files, chunk_size=32, **frontend_kwargs):
+    specs = [melspectrogram_batch(files[i:i + chunk_size], **frontend_kwargs) for i in range(0, len(files), chunk_size)]
+    return np.concatenate(specs)
+
+
+# (path, model output index) for every file of a train_audio/<class>/<file> tree. Labels come
+# from the species table, not from the position of the directory in this particular tree.
+def labelled_files(audio_root):
+    species = load_species()
+    items, classes = list_train_audio(audio_root)
+    known = set(species.labels)
+    unknown = [name for name in classes if name not in known]
+    if unknown:
+        raise ValueError(f"{audio_root} has class directories missing from the species table: {', '.join(unknown)}")
+    return [(path, species.index_of(name)) for path, name, _ in items]
+
+
+# Convert a (stripped) Keras classifier to a TFLite flatbuffer.
+#   float16: weights stored as float16, computation in float32
+#   int8: full integer quantization of weights and activations, int8 input and output;
+#         calibrated on `representative` (N, img, img) single-channel spectrograms
+def convert(model, variant="float16", representative=None, img_size=256):
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown TFLite variant {variant!r}, expected one of {VARIANTS}")
+    serve = tf.function(lambda x: model(x, training=False),
+                        input_signature=[tf.TensorSpec([None, img_size, img_size, 3], tf.float32, name="spectrogram")])
+    # Keras 3 weights would otherwise stay resource variables (READ_VARIABLE ops) in the flatbuffer
+    frozen = convert_variables_to_constants_v2(serve.get_concrete_function())
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([frozen])
+    if variant == "float16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif variant == "int8":
+        if representative is None or len(representative) == 0:
+            raise ValueError("int8 conversion needs representative spectrograms for calibration")
+
+        def representative_dataset():
+            for spectrogram in representative:
+                yield [to_three_channels(spectrogram[None]).astype(np.float32)]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    return converter.convert()
+
+
+# Agreement of each candidate predict function with the float reference on the same spectrograms:
+# top-1 agreement, how often the reference top-1 is in the candidate's top 5, and the absolute
+# probability deltas; plus top-1 accuracy of every model when labels are given (model output
+# indices). spectrograms are single-channel; each batch is viewed as 3 channels on the way in.
+def accuracy_report(reference, candidates, spectrograms, labels=None, batch_size=32):
+    def run(predict_fn):
+        return np.concatenate([predict_fn(to_three_channels(spectrograms[i:i + batch_size]))
+                               for i in range(0, len(spectrograms), batch_size)])
+
+    expected = run(reference)
+    expected_top1 = expected.argmax(axis=1)
+    report = {}
+    if labels is not None:
+        labels = np.asarray(labels)
+        report["reference"] = {"accuracy": float(np.mean(expected_top1 == labels))}
+    for name, predict_fn in candidates.items():
+        probabilities = run(predict_fn)
+        top5 = np.argsort(probabilities, axis=1)[:, -5:]
+        delta = np.abs(probabilities - expected)
+        result = {
+            "top1_agreement": float(np.mean(probabilities.argmax(axis=1) == expected_top1)),
+            "top5_contains_reference": float(np.mean([t in row for t, row in zip(expected_top1, top5)])),
+            "max_abs_delta": float(delta.max()),
+            "mean_abs_delta": float(delta.mean()),
+        }
+        if labels is not None:
+            result["accuracy"] = float(np.mean(probabilities.argmax(axis=1) == labels))
+            result["accuracy_delta"] = result["accuracy"] - report["reference"]["accuracy"]
+        report[name] = result
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the classifier to TFLite and report the accuracy delta of each variant")
+    parser.add_argument("checkpoint")
+    parser.add_argument("out_dir")
+    parser.add_argument("--audio-root", required=True, help="train_audio/<class>/<file> tree for calibration and evaluation")
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS[1:], default=["float16", "int8"])
+    parser.add_argument("--calibration-samples", type=int, default=200)
+    parser.add_argument("--eval-samples", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=123)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    model = strip_for_inference(load_checkpoint(args.checkpoint))
+
+    # Disjoint calibration and evaluation files
+    items = labelled_files(args.audio_root)
+    random.Random(args.seed).shuffle(items)
+    calibration = items[:args.calibration_samples]
+    evaluation = items[args.calibration_samples:args.calibration_samples + args.eval_samples]
+    representative = spectrograms_for([path for path, _ in calibration])
+    eval_spectrograms = spectrograms_for([path for path, _ in evaluation])
+
+    candidates = {}
+    sizes = {}
+    for variant in args.variants:
+        path = os.path.join(args.out_dir, f"model-{variant}.tflite")
+        with open(path, "wb") as f:
+            f.write(convert(model, variant, representative=representative))
+        sizes[variant] = os.path.getsize(path)
+        candidates[variant] = TFLitePredictor(path)
+        print(f"Wrote {path} ({sizes[variant] / 2 ** 20:.1f} MiB)")
+
+    report = accuracy_report(CompiledPredictor(model), candidates, eval_spectrograms, labels=[label for _, label in evaluation])
+    for variant, size in sizes.items():
+        report[variant]["size_bytes"] = size
+    with open(os.path.join(args.out_dir, "report.json"), "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"float32 accuracy on {len(evaluation)} files: {report['reference']['accuracy']:.3f}")
+    for variant in args.variants:
+        r = report[variant]
+        print(f"{variant}: accuracy {r['accuracy']:.3f} ({r['accuracy_delta']:+.3f}), top-1 agreement {r['top1_agreement']:.3f}, "
+              f"top-5 contains float top-1 {r['top5_contains_reference']:.3f}, max |dp| {r['max_abs_delta']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
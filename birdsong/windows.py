@@ -0,0 +1,232 @@
+from itertools import chain
+
+import numpy as np
+
+from birdsong.decode import iter_blocks
+from birdsong.melspec import frontend_geometry, get_plan, mel_power_batch, power_to_image, to_three_channels
+
+
+# Fixed-length analysis windows over a stream of sample blocks: yields (start_seconds, waveform).
+# Only about one window plus one block is buffered. When the regular hops do not reach the
+# end of the recording, a last window aligned to the end is added; recordings shorter than
+# one window come out as a single short window.
+def iter_windows(blocks, sr=22050, window=5.0, hop=5.0):
+    win = int(window * sr)
+    step = max(int(hop * sr), 1)
+    buf = np.zeros(0, dtype=np.float32)
+    buf_start = 0
+    next_start = 0
+    total = 0
+    last_end = 0
+
+    for block in blocks:
+        buf = np.concatenate([buf, block])
+        total += len(block)
+        while next_start + win <= total:
+            offset = next_start - buf_start
+            yield next_start / sr, buf[offset:offset + win]
+            last_end = next_start + win
+            next_start += step
+        # Keep what the next regular window or a final end-aligned window may still need
+        keep_from = min(next_start, max(total - win, 0))
+        if keep_from > buf_start:
+            buf = buf[keep_from - buf_start:]
+            buf_start = keep_from
+
+    if total == 0:
+        return
+    if last_end == 0:
+        yield 0.0, buf
+    elif last_end < total:
+        start = total - win
+        yield start / sr, buf[start - buf_start:]
+
+
+# Mel power of analysis windows cut from one stream-wide STFT: yields (start_seconds, mel_power).
+# Every STFT frame is computed once however much the windows overlap, and only about one
+# window of frames plus one block of samples is held. Frames follow the stream's own
+# centered grid, so window starts are rounded to a multiple of hop_length and the inner
+# window edges see the neighbouring audio rather than zero padding; otherwise each window
+# matches what audio_to_melspectrogram computes for the same span.
+def iter_shared_mel_windows(blocks, sr=22050, window=5.0, hop=5.0, n_fft=2048, hop_length=512, n_mels=128, img_size=256, geometry="resize"):
+    win = int(window * sr)
+    n_mels, hop_length = frontend_geometry(win, n_mels, hop_length, img_size, geometry)
+    plan = get_plan(sr, n_fft, hop_length, n_mels)
+    win_frames = 1 + win // hop_length
+    hop_frames = max(round(hop * sr / hop_length), 1)
+    pad = n_fft // 2
+
+    samples = np.zeros(pad, dtype=np.float32)  # leading zero padding of the centered STFT
+    sample_start = -pad
+    mel = np.zeros((n_mels, 0), dtype=np.float32)
+    mel_start = 0
+    next_frame = 0
+    next_window = 0
+    last_end = 0
+    total = 0
+
+    for block in chain(blocks, [None]):
+        if block is None:
+            # End of stream: trailing zero padding, up to the last centered frame
+            samples = np.concatenate([samples, np.zeros(pad, dtype=np.float32)])
+            n_frames = 1 + total // hop_length if total else 0
+        else:
+            samples = np.concatenate([samples, block])
+            total += len(block)
+            n_frames = None
+
+        # STFT frames that are now fully available
+        offset = next_frame * hop_length - pad - sample_start
+        count = max(0, 1 + (len(samples) - offset - n_fft) // hop_length)
+        if n_frames is not None:
+            count = min(count, n_frames - next_frame)
+        if count > 0:
+            segment = samples[offset:offset + (count - 1) * hop_length + n_fft]
+            mel = np.concatenate([mel, np.matmul(plan.mel_basis, plan.power_spectrum(segment, center=False))], axis=1)
+            next_frame += count
+        consumed = min(next_frame * hop_length - pad - sample_start, len(samples))
+        if consumed > 0:
+            samples = samples[consumed:]
+            sample_start += consumed
+
+        while next_window + win_frames <= next_frame:
+            offset = next_window - mel_start
+            yield next_window * hop_length / sr, mel[:, offset:offset + win_frames]
+            last_end = next_window + win_frames
+            next_window += hop_frames
+        keep_from = min(next_window, max(next_frame - win_frames, 0))
+        if keep_from > mel_start:
+            mel = mel[:, keep_from - mel_start:]
+            mel_start = keep_from
+
+    if total == 0:
+        return
+    if last_end == 0:
+        yield 0.0, mel
+    elif last_end < next_frame:
+        start = next_frame - win_frames
+        yield start * hop_length / sr, mel[:, start - mel_start:]
+
+
+# Group an iterator into lists of at most batch_size items
+def _batched(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# Un-normalised mel power of every analysis window: yields (start_seconds, mel_power).
+# shared_stft=True cuts overlapping windows out of one stream-wide STFT instead of
+# recomputing the STFT of every window.
+def iter_window_mel_power(source, sr=22050, window=5.0, hop=5.0, batch_size=32, block_duration=30.0, shared_stft=False,
+                          n_fft=2048, hop_length=512, n_mels=128, img_size=256, geometry="resize"):
+    blocks = iter_blocks(source, sr=sr, block_duration=block_duration)
+    if shared_stft:
+        yield from iter_shared_mel_windows(blocks, sr=sr, window=window, hop=hop, n_fft=n_fft, hop_length=hop_length, n_mels=n_mels, img_size=img_size, geometry=geometry)
+        return
+
+    for batch in _batched(iter_windows(blocks, sr=sr, window=window, hop=hop), batch_size):
+        # All windows share one length, except a recording shorter than one window
+        waveforms = [y for _, y in batch]
+        window_mels, window_hop = frontend_geometry(len(waveforms[0]), n_mels, hop_length, img_size, geometry)
+        power = mel_power_batch(waveforms, sr=sr, n_fft=n_fft, hop_length=window_hop, n_mels=window_mels)
+        yield from zip([start for start, _ in batch], power)
+
+
+# Cheap activity measures of one window, from its mel power before any normalisation:
+# - energy_db: mean power of the mel bands centred in [fmin, fmax], in dB relative to what
+#   full-scale white noise gives in that band (so band-limited noise at -40 dBFS reads -40)
+# - flux: mean positive frame-to-frame dB change of those bands (onsets, calls)
+def window_activity(mel_power, sr=22050, n_fft=2048, fmin=1000.0, fmax=10000.0, amin=1e-10):
+    import librosa
+    n_mels = mel_power.shape[0]
+    centres = librosa.mel_frequencies(n_mels + 2, fmin=0.0, fmax=sr // 2)[1:-1]
+    band = (centres >= fmin) & (centres <= fmax)
+    plan = get_plan(sr, n_fft, 512, n_mels)
+    reference = np.sum(plan.window.astype(np.float64) ** 2) * plan.mel_basis[band].sum()
+
+    band_power = mel_power[band]
+    energy_db = 10.0 * np.log10(max(amin, band_power.sum(axis=0).mean() / reference))
+    band_db = 10.0 * np.log10(np.maximum(amin, band_power))
+    flux = float(np.maximum(np.diff(band_db, axis=1), 0).mean()) if band_db.shape[1] > 1 else 0.0
+    return float(energy_db), flux
+
+
+# True if the window should go on to the CNN; a threshold of None disables that test
+def passes_gate(mel_power, sr=22050, n_fft=2048, energy_threshold_db=None, flux_threshold=None, band=(1000.0, 10000.0)):
+    if energy_threshold_db is None and flux_threshold is None:
+        return True
+    energy_db, flux = window_activity(mel_power, sr=sr, n_fft=n_fft, fmin=band[0], fmax=band[1])
+    if energy_threshold_db is not None and energy_db < energy_threshold_db:
+        return False
+    if flux_threshold is not None and flux < flux_threshold:
+        return False
+    return True
+
+
+# Single-channel window spectrograms for a whole recording: yields (start_seconds, spectrogram),
+# with spectrogram None for windows the energy/flux gate rejected
+def iter_window_spectrograms(source, sr=22050, window=5.0, hop=5.0, batch_size=32, energy_threshold_db=None, flux_threshold=None,
+                             gate_band=(1000.0, 10000.0), **kwargs):
+    img_size = kwargs.get("img_size", 256)
+    n_fft = kwargs.get("n_fft", 2048)
+    for batch in _batched(iter_window_mel_power(source, sr=sr, window=window, hop=hop, batch_size=batch_size, **kwargs), batch_size):
+        keep = [passes_gate(power, sr=sr, n_fft=n_fft, energy_threshold_db=energy_threshold_db, flux_threshold=flux_threshold, band=gate_band)
+                for _, power in batch]
+        specs = iter([])
+        if any(keep):
+            specs = iter(power_to_image(np.stack([power for (_, power), k in zip(batch, keep) if k]), img_size=img_size))
+        for (start, _), k in zip(batch, keep):
+            yield start, next(specs) if k else None
+
+
+# Per-window probabilities for a whole recording: yields (start_seconds, probabilities),
+# with probabilities None for windows skipped by the gate (they never reach the model).
+# predict_fn maps a (batch, img_size, img_size, 3) array to (batch, n_classes) probabilities.
+def iter_window_predictions(source, predict_fn, sr=22050, window=5.0, hop=5.0, batch_size=32, **kwargs):
+    spectrograms = iter_window_spectrograms(source, sr=sr, window=window, hop=hop, batch_size=batch_size, **kwargs)
+    for batch in _batched(spectrograms, batch_size):
+        active = [spec for _, spec in batch if spec is not None]
+        probabilities = iter([])
+        if active:
+            probabilities = iter(np.asarray(predict_fn(to_three_channels(np.stack(active)))))
+        for start, spec in batch:
+            yield start, next(probabilities) if spec is not None else None
+
+
+def pool_probabilities(probabilities, pooling="max"):
+    if pooling == "max":
+        return probabilities.max(axis=0)
+    if pooling == "mean":
+        return probabilities.mean(axis=0)
+    raise ValueError(f"Unknown pooling {pooling!r}, expected 'max' or 'mean'")
+
+
+# Long-recording mode: probability timeline of every window plus a file-level aggregate.
+# Windows skipped by the gate are flagged in "skipped" and have NaN probabilities; the
+# aggregate pools the analysed windows only and is None if every window was skipped.
+def analyze_recording(source, predict_fn, sr=22050, window=5.0, hop=5.0, batch_size=32, pooling="max", **kwargs):
+    starts = []
+    results = []
+    for start, probs in iter_window_predictions(source, predict_fn, sr=sr, window=window, hop=hop, batch_size=batch_size, **kwargs):
+        starts.append(start)
+        results.append(probs)
+
+    skipped = np.array([probs is None for probs in results], dtype=bool)
+    analysed = [probs for probs in results if probs is not None]
+    n_classes = len(analysed[0]) if analysed else 0
+    probabilities = np.full((len(results), n_classes), np.nan, dtype=np.float32)
+    if analysed:
+        probabilities[~skipped] = np.stack(analysed)
+    return {
+        "starts": np.asarray(starts),
+        "probabilities": probabilities,
+        "skipped": skipped,
+        "aggregate": pool_probabilities(probabilities[~skipped], pooling) if analysed else None,
+    }
+